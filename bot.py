@@ -67,7 +67,10 @@ class Combot(commands.Bot):
             
             # Initialize YouTube service
             logger.info("Initializing YouTube service...")
-            self.youtube_service = YouTubeService(env_config.youtube_api_key)
+            self.youtube_service = YouTubeService(
+                env_config.youtube_api_key,
+                env_config.youtube_cache_filename
+            )
             
             # Setup commands
             logger.info("Setting up commands...")
@@ -194,10 +197,10 @@ class Combot(commands.Bot):
             except Exception as e:
                 logger.error(f"Error during data manager cleanup: {e}")
         
-        # Clear YouTube service cache
+        # Clear YouTube service cache; persisted playlists are kept for the next start
         if self.youtube_service:
             try:
-                self.youtube_service.clear_cache()
+                await self.youtube_service.clear_cache(include_disk=False)
                 logger.info("YouTube service cache cleared")
             except Exception as e:
                 logger.error(f"Error clearing YouTube cache: {e}")
@@ -445,6 +445,7 @@ class AdminCommands(commands.Cog):
             # Add category
             self.data_manager.config.combo_categories.append(name)
             self.data_manager.config.starters[name] = []
+            self.data_manager.mark_config_changed()
             await self.data_manager.save(force=True)
             
             await interaction.response.send_message(
@@ -511,14 +512,8 @@ class AdminCommands(commands.Cog):
             
             # Find and remove player
             name = name.strip()
-            original_count = len(self.data_manager.config.notable_players)
             
-            self.data_manager.config.notable_players = [
-                p for p in self.data_manager.config.notable_players
-                if p.get("name", "").lower() != name.lower()
-            ]
-            
-            if len(self.data_manager.config.notable_players) < original_count:
+            if await self.data_manager.remove_player(name):
                 await self.data_manager.save(force=True)
                 await interaction.response.send_message(
                     f"✅ Removed player **{name}**.",
@@ -603,10 +598,9 @@ class AdminCommands(commands.Cog):
             )
             
             # Stats
-            total_starters = sum(len(starters) for starters in config.starters.values())
             embed.add_field(
                 name="📊 Stats",
-                value=f"Total Starters: {total_starters}\n"
+                value=f"Total Starters: {config.total_starters}\n"
                       f"Notable Players: {len(config.notable_players)}",
                 inline=True
             )
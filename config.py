@@ -4,9 +4,12 @@ Handles environment variables and bot configuration dataclasses
 """
 
 import os
+import copy
 import logging
-from typing import Set, Dict, Any, List
+from typing import Set, Dict, Any, Callable, FrozenSet, Iterable, List, Tuple
 from dataclasses import dataclass, field, asdict
+from functools import cached_property
+from urllib.parse import urlparse
 from enum import Enum
 
 import discord
@@ -22,6 +25,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Characters replaced when building category custom_ids
+_CID_TABLE = str.maketrans({c: '-' for c in ' /?#&=%+'})
+
 
 class ConfigKey(str, Enum):
     """Configuration keys for type safety"""
@@ -52,6 +58,77 @@ class PageSizes:
     resources: int = 10
 
 
+# Social link domains and their display names
+_SOCIAL_PLATFORMS = {
+    "twitter.com": "Twitter/X",
+    "x.com": "Twitter/X",
+    "youtube.com": "YouTube",
+    "twitch.tv": "Twitch",
+    "instagram.com": "Instagram",
+}
+
+
+@dataclass
+class PlayerEntry:
+    """Represents a notable player with all their information"""
+    name: str
+    social_link: str
+    region_emoji: str = ""
+    image_url: str = ""
+    description_lines: List[str] = field(default_factory=list)
+    color_footer: str = ""
+    
+    def __post_init__(self):
+        """Validate player entry data"""
+        if not self.name.strip():
+            raise ValueError("Player name cannot be empty")
+        if not self.social_link.strip():
+            raise ValueError("Player social link cannot be empty")
+    
+    @cached_property
+    def name_lower(self) -> str:
+        """Lowercased name for case-insensitive lookups"""
+        return self.name.lower()
+    
+    @cached_property
+    def title(self) -> str:
+        """Embed title with name and region"""
+        return f"{self.name} {self.region_emoji}".strip()
+    
+    @cached_property
+    def description_text(self) -> str:
+        """Embed description from the description lines"""
+        if self.description_lines:
+            return "\n".join(self.description_lines)
+        return "_No description available._"
+    
+    @cached_property
+    def footer_prefix(self) -> str:
+        """Custom footer text placed before the position info"""
+        return f"{self.color_footer} • " if self.color_footer else ""
+    
+    @cached_property
+    def social_platform(self) -> str:
+        """Display name of the platform the social link points to"""
+        try:
+            host = urlparse(self.social_link).hostname or ""
+        except ValueError:
+            host = ""
+        # Look up the host and each parent domain, so www./m. subdomains match too
+        labels = host.split(".")
+        for i in range(len(labels) - 1):
+            platform = _SOCIAL_PLATFORMS.get(".".join(labels[i:]))
+            if platform:
+                return platform
+        return "Social Media"
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PlayerEntry':
+        """Create from a stored player dictionary, ignoring unknown keys"""
+        valid_fields = cls.__dataclass_fields__.keys()
+        return cls(**{k: v for k, v in data.items() if k in valid_fields})
+
+
 @dataclass
 class BotConfiguration:
     """Main bot configuration with validation and utility methods"""
@@ -65,10 +142,193 @@ class BotConfiguration:
     ender_info_credit: str = ""
     info_section_routes_title: str = "📌 Interesting Routes"
     interesting_routes: List[str] = field(default_factory=list)
-    notable_players: List[Dict[str, Any]] = field(default_factory=list)
+    notable_players: List[PlayerEntry] = field(default_factory=list)
     page_sizes: PageSizes = field(default_factory=PageSizes)
     view_timeout_seconds: float = 180.0
     
+    def __post_init__(self):
+        """Normalize loaded values and initialize derived state that isn't persisted"""
+        # Category names become button labels and ids, so they must be strings
+        self.combo_categories = [str(category) for category in self.combo_categories]
+        # Stored players are plain dicts; keep typed entries in memory and
+        # hold on to entries that fail validation so saving doesn't drop them
+        self.notable_players, self._invalid_players = self._load_players(self.notable_players)
+        
+        # Bumped on every mutation so views can reuse embeds built from this config
+        self._version = 0
+        self._derived_cache: Dict[str, Tuple[int, Any]] = {}
+    
+    @property
+    def version(self) -> int:
+        """Get the configuration version, incremented on each change"""
+        return self._version
+    
+    def mark_changed(self) -> None:
+        """Record a configuration change and drop values derived from the old values"""
+        self._version += 1
+        self._derived_cache.clear()
+    
+    def get_cached(self, key: str, build: Callable[[], Any]) -> Any:
+        """
+        Get a value derived from this configuration, rebuilding it after changes
+        
+        Args:
+            key: Cache key identifying the value
+            build: Function that builds the value
+            
+        Returns:
+            Cached value for the current configuration version
+        """
+        entry = self._derived_cache.get(key)
+        if entry is None or entry[0] != self._version:
+            entry = (self._version, build())
+            self._derived_cache[key] = entry
+        return entry[1]
+    
+    def get_cached_embed(self, key: str, build: Callable[[], discord.Embed]) -> discord.Embed:
+        """
+        Get an embed built from this configuration, rebuilding it after changes
+        
+        Args:
+            key: Cache key identifying the embed
+            build: Function that builds the embed
+            
+        Returns:
+            Deep copy of the cached embed, so callers adding fields or a footer
+            can't alter the cached one
+        """
+        # copy.copy and, in some discord.py versions, Embed.copy share the field list
+        return copy.deepcopy(self.get_cached(key, build))
+    
+    @property
+    def combo_categories_set(self) -> FrozenSet[str]:
+        """Get combo categories as a set for constant-time membership checks"""
+        return self.get_cached("combo_categories_set", lambda: frozenset(self.combo_categories))
+    
+    @property
+    def combo_category_labels(self) -> Tuple[str, ...]:
+        """Get category names truncated to Discord's button label limit"""
+        return self.get_cached(
+            "combo_category_labels",
+            lambda: tuple(category[:80] for category in self.combo_categories)
+        )
+    
+    @property
+    def combo_category_ids(self) -> Tuple[str, ...]:
+        """Get unique custom_id-safe forms of the category names"""
+        return self.get_cached("combo_category_ids", self._build_category_ids)
+    
+    def _build_category_ids(self) -> Tuple[str, ...]:
+        """Sanitize category names for custom_ids, keeping them unique"""
+        ids = []
+        seen = set()
+        for i, category in enumerate(self.combo_categories):
+            safe_category = category.translate(_CID_TABLE)[:90]  # Keep within Discord limits
+            # Names that sanitize to the same id get the index appended to stay unique
+            if safe_category in seen:
+                safe_category = f"{safe_category[:85]}-{i}"
+            seen.add(safe_category)
+            ids.append(safe_category)
+        return tuple(ids)
+    
+    @staticmethod
+    def _load_players(players: Iterable[Any]) -> Tuple[List[PlayerEntry], List[Any]]:
+        """
+        Convert stored player dicts to entries
+        
+        Args:
+            players: Stored player dicts or entries
+            
+        Returns:
+            Tuple of (valid entries, raw stored values that failed validation)
+        """
+        entries = []
+        invalid = []
+        for player in players:
+            if isinstance(player, PlayerEntry):
+                entries.append(player)
+                continue
+            try:
+                entries.append(PlayerEntry.from_dict(player))
+            except (TypeError, ValueError, AttributeError) as e:
+                logger.warning(f"Keeping invalid notable player {player!r} out of menus: {e}")
+                invalid.append(player)
+        return entries, invalid
+    
+    @property
+    def players_by_name(self) -> Dict[str, PlayerEntry]:
+        """Get notable players keyed by lowercased name"""
+        return self.get_cached(
+            "players_by_name",
+            lambda: {p.name_lower: p for p in self.notable_players}
+        )
+    
+    def add_player(self, player: PlayerEntry) -> None:
+        """
+        Append a notable player
+        
+        Args:
+            player: Player to add
+        """
+        self.notable_players.append(player)
+        self.mark_changed()
+    
+    def remove_player(self, name: str) -> bool:
+        """
+        Remove a notable player by name
+        
+        Args:
+            name: Player name, compared case-insensitively
+            
+        Returns:
+            True if a player was removed, False otherwise
+        """
+        player = self.players_by_name.get(name.lower())
+        if player is None:
+            return False
+        self.notable_players.remove(player)
+        self.mark_changed()
+        return True
+    
+    @property
+    def total_starters(self) -> int:
+        """Get the number of starters across all categories"""
+        return self.get_cached(
+            "total_starters",
+            lambda: sum(len(starters) for starters in self.starters.values())
+        )
+    
+    @property
+    def stats_text(self) -> str:
+        """Get the bot stats summary shown on the main menu"""
+        return self.get_cached(
+            "stats_text",
+            lambda: f"• {len(self.combo_categories)} categories\n"
+                    f"• {self.total_starters} total starters\n"
+                    f"• {len(self.notable_players)} notable players"
+        )
+    
+    @property
+    def ender_info_rendered(self) -> str:
+        """Get ender info lines joined into an embed description"""
+        return self.get_cached("ender_info_rendered", lambda: self._render_description(self.ender_info))
+    
+    @property
+    def routes_rendered(self) -> str:
+        """Get interesting routes as a bulleted embed description"""
+        return self.get_cached(
+            "routes_rendered",
+            lambda: self._render_description(f"• {route}" for route in self.interesting_routes)
+        )
+    
+    @staticmethod
+    def _render_description(lines: Iterable[str]) -> str:
+        """Join lines and truncate to fit within Discord's description limit"""
+        description = "\n".join(lines)
+        if len(description) > 4000:
+            description = description[:3997] + "..."
+        return description
+    
     @property
     def embed_color(self) -> discord.Color:
         """Get Discord color from hex string with validation"""
@@ -88,6 +348,8 @@ class BotConfiguration:
         data['page_size_combos'] = page_sizes['combos']
         data['page_size_players'] = page_sizes['players']
         data['page_size_resources'] = page_sizes['resources']
+        # Write invalid stored players back unchanged so they can be fixed by hand
+        data['notable_players'].extend(copy.deepcopy(self._invalid_players))
         return data
     
     @classmethod
@@ -116,6 +378,7 @@ class EnvConfig:
     youtube_api_key: str
     owner_ids: Set[int]
     config_filename: str = "character_bot_data.json"
+    youtube_cache_filename: str = "youtube_cache.json"
     
     @classmethod
     def from_env(cls) -> 'EnvConfig':
@@ -140,6 +403,7 @@ class EnvConfig:
         # Optional variables
         owner_ids_str = os.getenv("DISCORD_OWNER_IDS", "")
         config_file = os.getenv("CONFIG_FILENAME", "character_bot_data.json")
+        youtube_cache_file = os.getenv("YOUTUBE_CACHE_FILENAME", "youtube_cache.json")
         
         # Parse owner IDs with validation
         owner_ids = set()
@@ -157,11 +421,12 @@ class EnvConfig:
         
         logger.info(f"Loaded configuration:")
         logger.info(f"  - Config file: {config_file}")
+        logger.info(f"  - YouTube cache file: {youtube_cache_file}")
         logger.info(f"  - Owner IDs: {len(owner_ids)} configured")
         logger.info(f"  - Discord token: {'✓' if token else '✗'}")
         logger.info(f"  - YouTube API key: {'✓' if yt_key else '✗'}")
         
-        return cls(token, yt_key, owner_ids, config_file)
+        return cls(token, yt_key, owner_ids, config_file, youtube_cache_file)
     
     def validate_setup(self) -> None:
         """Validate that all required components are properly configured"""
@@ -186,6 +451,8 @@ except Exception as e:
 CACHE_DURATION_SECONDS = 600  # 10 minutes
 MAX_EMBED_FIELD_VALUE_LENGTH = 1000
 MAX_EMBED_DESCRIPTION_LENGTH = 4000
+MAX_EMBED_TOTAL_LENGTH = 6000
+MAX_MESSAGE_LENGTH = 2000
 MAX_LINES_FOR_CONFIG_DISPLAY = 25
 MAX_CUSTOM_ID_LENGTH = 100
 MODAL_DEFAULT_VALUE_MAX_LEN = 1900
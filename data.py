@@ -8,13 +8,18 @@ import asyncio
 import time
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, asdict
+from functools import cached_property
 
-from config import BotConfiguration
+from config import BotConfiguration, PlayerEntry
+from utils import format_combo_notation
 
 logger = logging.getLogger(__name__)
 
+# Substring length used by the combo search index
+SEARCH_NGRAM_SIZE = 3
+
 
 @dataclass
 class ComboEntry:
@@ -29,6 +34,37 @@ class ComboEntry:
             raise ValueError("Combo notation cannot be empty")
         if not self.link.strip():
             raise ValueError("Combo link cannot be empty")
+    
+    @cached_property
+    def formatted_notation(self) -> str:
+        """Notation formatted for display, computed once per entry"""
+        return format_combo_notation(self.notation)
+    
+    @cached_property
+    def has_notes(self) -> bool:
+        """Whether the combo has meaningful notes worth displaying"""
+        return bool(self.notes.strip()) and self.notes != "No Notes Provided"
+    
+    @cached_property
+    def notation_lower(self) -> str:
+        """Lowercased notation for case-insensitive search"""
+        return self.notation.lower()
+    
+    @cached_property
+    def notes_lower(self) -> str:
+        """Lowercased notes for case-insensitive search"""
+        return self.notes.lower()
+    
+    @cached_property
+    def search_text(self) -> str:
+        """Lowercased notation and notes joined for single-pass searching"""
+        # NUL separator keeps a term from matching across the two fields
+        return f"{self.notation_lower}\0{self.notes_lower}"
+    
+    @cached_property
+    def search_bytes(self) -> bytes:
+        """UTF-8 encoded search text for byte-level substring scans"""
+        return self.search_text.encode("utf-8")
 
 
 @dataclass
@@ -49,24 +85,6 @@ class ResourceEntry:
             raise ValueError("Resource link cannot be empty")
 
 
-@dataclass
-class PlayerEntry:
-    """Represents a notable player with all their information"""
-    name: str
-    region_emoji: str
-    social_link: str
-    image_url: str
-    description_lines: List[str]
-    color_footer: str
-    
-    def __post_init__(self):
-        """Validate player entry data"""
-        if not self.name.strip():
-            raise ValueError("Player name cannot be empty")
-        if not self.social_link.strip():
-            raise ValueError("Player social link cannot be empty")
-
-
 class DataManager:
     """
     Centralized async data management with validation, caching, and atomic writes
@@ -77,6 +95,7 @@ class DataManager:
     - Atomic writes to prevent corruption
     - Data validation and error handling
     - Forced saves for critical operations
+    - Trigram search index over combo notation and notes
     """
     
     def __init__(self, file_path: str):
@@ -89,6 +108,9 @@ class DataManager:
         self._last_save = time.time()
         self._save_interval = 5.0  # Debounce saves for 5 seconds
         self._save_task: Optional[asyncio.Task] = None
+        self._search_index: Optional[Dict[str, Set[Tuple[str, str, int]]]] = None
+        self._combo_cache: Dict[Tuple[str, str], List[ComboEntry]] = {}
+        self._resource_entries: Optional[Tuple[str, List[ResourceEntry]]] = None
     
     async def load(self) -> None:
         """Load data from file with error handling and validation"""
@@ -129,6 +151,8 @@ class DataManager:
                 self._config = BotConfiguration()
             
             # Initialize combo data structures
+            self._search_index = None
+            self._combo_cache.clear()
             for category in self._config.combo_categories:
                 if category not in self._config.starters:
                     self._config.starters[category] = []
@@ -146,6 +170,7 @@ class DataManager:
             except Exception as e:
                 logger.error(f"Error loading resources: {e}")
                 self._resources = {"note": "Additional resources", "resources": []}
+            self._resource_entries = None
             
             logger.info(f"Data loaded successfully for: {self._config.character_name}")
             logger.info(f"Categories: {len(self._config.combo_categories)}")
@@ -161,7 +186,7 @@ class DataManager:
         """
         now = time.time()
         
-        # Skip if not dirty and not forced
+        # Nothing changed since the last write; a forced save always writes
         if not force and not self._dirty:
             return
         
@@ -176,43 +201,47 @@ class DataManager:
             self._save_task.cancel()
         
         async with self._lock:
-            try:
-                # Prepare data for saving
-                data = {
-                    "config": self._config.to_dict() if self._config else {},
-                    "RESOURCES": self._resources
-                }
-                
-                # Add combo data for each category
-                for category, combos in self._combo_data.items():
-                    data[category] = combos
-                
-                # Atomic write using temporary file
-                temp_file = self.file_path.with_suffix('.tmp')
-                
-                def write_file():
-                    """Synchronous file write operation"""
-                    with open(temp_file, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2, ensure_ascii=False)
-                    # Atomic replace
-                    temp_file.replace(self.file_path)
-                
-                # Execute write in thread pool
-                await asyncio.to_thread(write_file)
-                
-                self._dirty = False
-                self._last_save = now
-                logger.info(f"Data saved successfully to {self.file_path}")
-                
-            except Exception as e:
-                logger.error(f"Error saving data: {e}")
-                # Clean up temp file if it exists
-                if temp_file.exists():
-                    try:
-                        temp_file.unlink()
-                    except:
-                        pass
-                raise
+            await self._write_locked()
+    
+    async def _write_locked(self) -> None:
+        """Serialize and atomically write all data; the caller must hold the lock"""
+        now = time.time()
+        temp_file = self.file_path.with_suffix('.tmp')
+        try:
+            # Prepare data for saving
+            data = {
+                "config": self._config.to_dict() if self._config else {},
+                "RESOURCES": self._resources
+            }
+            
+            # Add combo data for each category
+            for category, combos in self._combo_data.items():
+                data[category] = combos
+            
+            # Atomic write using temporary file
+            def write_file():
+                """Synchronous file write operation"""
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                # Atomic replace
+                temp_file.replace(self.file_path)
+            
+            # Execute write in thread pool
+            await asyncio.to_thread(write_file)
+            
+            self._dirty = False
+            self._last_save = now
+            logger.info(f"Data saved successfully to {self.file_path}")
+            
+        except Exception as e:
+            logger.error(f"Error saving data: {e}")
+            # Clean up temp file if it exists
+            if temp_file.exists():
+                try:
+                    temp_file.unlink()
+                except:
+                    pass
+            raise
     
     async def _delayed_save(self) -> None:
         """Execute delayed save after debounce interval"""
@@ -231,30 +260,58 @@ class DataManager:
             raise RuntimeError("DataManager not loaded. Call load() first.")
         return self._config
     
-    async def update_config(self, **kwargs) -> None:
+    def mark_config_changed(self) -> None:
+        """Record an in-place configuration change so it is saved and derived values rebuild"""
+        self.config.mark_changed()
+        self._dirty = True
+    
+    def has_player(self, name: str) -> bool:
+        """
+        Check whether a notable player with this name exists
+        
+        Args:
+            name: Player name, compared case-insensitively
+            
+        Returns:
+            True if the player exists, False otherwise
+        """
+        return name.lower() in self.config.players_by_name
+    
+    async def update_config(self, persist: bool = False, **kwargs) -> None:
         """
         Update configuration fields with validation
         
         Args:
+            persist: If True, write the changes to disk before releasing the lock
             **kwargs: Configuration fields to update
         """
         async with self._lock:
             updated_fields = []
             for key, value in kwargs.items():
-                if hasattr(self._config, key):
+                if not hasattr(self._config, key):
+                    logger.warning(f"Attempted to update unknown config field: {key}")
+                elif getattr(self._config, key) != value:
+                    # Only changed fields dirty the config
                     setattr(self._config, key, value)
                     updated_fields.append(key)
-                else:
-                    logger.warning(f"Attempted to update unknown config field: {key}")
             
             if updated_fields:
+                self._config.mark_changed()
                 self._dirty = True
                 logger.info(f"Updated config fields: {', '.join(updated_fields)}")
+                
+                if persist:
+                    # Cancel any pending delayed save; this write covers it
+                    if self._save_task and not self._save_task.done():
+                        self._save_task.cancel()
+                    await self._write_locked()
     
     async def get_combos(self, category: str, starter: str) -> List[ComboEntry]:
         """
         Get combos for a category/starter combination
         
+        Entries are cached until the starter's combos are updated or removed.
+        
         Args:
             category: Combo category
             starter: Starter name
@@ -262,12 +319,33 @@ class DataManager:
         Returns:
             List of ComboEntry objects
         """
+        return list(self._cached_combos(category, starter))
+    
+    def _cached_combos(self, category: str, starter: str) -> List[ComboEntry]:
+        """
+        Get the shared cached combo entries, parsing the stored combos on first use
+        
+        Args:
+            category: Combo category
+            starter: Starter name
+            
+        Returns:
+            Cached list of ComboEntry objects; callers must not modify it
+        """
+        key = (category, starter)
+        cached = self._combo_cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
             combos_data = self._combo_data.get(category, {}).get(starter, {}).get("combos", [])
-            return [ComboEntry(**c) for c in combos_data]
+            combos = [ComboEntry(**c) for c in combos_data]
         except Exception as e:
             logger.error(f"Error loading combos for {category}/{starter}: {e}")
-            return []
+            combos = []
+        
+        self._combo_cache[key] = combos
+        return combos
     
     async def update_combos(self, category: str, starter: str, 
                           combos: List[ComboEntry], note: str = "") -> None:
@@ -302,6 +380,8 @@ class DataManager:
                 "note": note or f"Combos for {starter}",
                 "combos": validated_combos
             }
+            self._search_index = None
+            self._combo_cache.pop((category, starter), None)
             self._dirty = True
             logger.info(f"Updated {len(validated_combos)} combos for {category}/{starter}")
     
@@ -312,6 +392,11 @@ class DataManager:
         Returns:
             Tuple of (note, list of ResourceEntry objects)
         """
+        # Entries are parsed once and reused until resources change
+        if self._resource_entries is not None:
+            note, resources = self._resource_entries
+            return note, list(resources)
+        
         try:
             note = self._resources.get("note", "")
             resources_data = self._resources.get("resources", [])
@@ -323,11 +408,30 @@ class DataManager:
                 except Exception as e:
                     logger.warning(f"Invalid resource skipped: {e}")
             
-            return note, resources
+            self._resource_entries = (note, resources)
+            return note, list(resources)
         except Exception as e:
             logger.error(f"Error loading resources: {e}")
             return "", []
     
+    def get_counts_snapshot(self) -> Dict[str, int]:
+        """
+        Get current resource and notable player counts without awaiting
+        
+        Returns:
+            Dictionary with 'resources' and 'notable_players' counts
+        """
+        # Parsed entries skip invalid resources, so prefer them once available
+        if self._resource_entries is not None:
+            resource_count = len(self._resource_entries[1])
+        else:
+            resource_count = len(self._resources.get("resources", []))
+        
+        return {
+            'resources': resource_count,
+            'notable_players': len(self.config.notable_players)
+        }
+    
     async def add_resource(self, resource: ResourceEntry) -> None:
         """
         Add a new resource
@@ -346,6 +450,7 @@ class DataManager:
                 )
                 
                 self._resources.setdefault("resources", []).append(asdict(validated_resource))
+                self._resource_entries = None
                 self._dirty = True
                 logger.info(f"Added resource: {resource.name}")
                 
@@ -353,6 +458,35 @@ class DataManager:
                 logger.error(f"Invalid resource rejected: {e}")
                 raise
     
+    async def add_player(self, player: PlayerEntry) -> None:
+        """
+        Add a new notable player
+        
+        Args:
+            player: PlayerEntry object to add
+        """
+        async with self._lock:
+            self._config.add_player(player)
+            self._dirty = True
+            logger.info(f"Added notable player: {player.name}")
+    
+    async def remove_player(self, name: str) -> bool:
+        """
+        Remove a notable player
+        
+        Args:
+            name: Player name, compared case-insensitively
+            
+        Returns:
+            True if the player was removed, False if not found
+        """
+        async with self._lock:
+            removed = self._config.remove_player(name)
+            if removed:
+                self._dirty = True
+                logger.info(f"Removed notable player: {name}")
+            return removed
+    
     async def add_starter(self, category: str, starter: str) -> None:
         """
         Add a starter to a category
@@ -367,6 +501,7 @@ class DataManager:
             
             if starter not in self._config.starters[category]:
                 self._config.starters[category].append(starter)
+                self._config.mark_changed()
                 self._dirty = True
                 logger.info(f"Added starter '{starter}' to category '{category}'")
     
@@ -389,12 +524,15 @@ class DataManager:
             if (category in self._config.starters and 
                 starter in self._config.starters[category]):
                 self._config.starters[category].remove(starter)
+                self._config.mark_changed()
                 removed_config = True
             
             # Remove combo data
             if (category in self._combo_data and 
                 starter in self._combo_data[category]):
                 del self._combo_data[category][starter]
+                self._search_index = None
+                self._combo_cache.pop((category, starter), None)
                 removed_data = True
             
             if removed_config or removed_data:
@@ -415,11 +553,76 @@ class DataManager:
         Returns:
             Number of combos
         """
-        try:
-            combos = await self.get_combos(category, starter)
-            return len(combos)
-        except Exception:
-            return 0
+        counts = await self.get_combo_counts(category, [starter])
+        return counts[starter]
+    
+    async def get_combo_counts(self, category: str, starters: List[str]) -> Dict[str, int]:
+        """
+        Get the number of combos for several starters in one call
+        
+        Args:
+            category: Category name
+            starters: Starter names
+            
+        Returns:
+            Dictionary mapping each starter to its number of combos
+        """
+        # Count through the same parse as get_combos, so malformed data counts as 0 combos
+        return {starter: len(self._cached_combos(category, starter)) for starter in starters}
+    
+    def _build_search_index(self) -> Dict[str, Set[Tuple[str, str, int]]]:
+        """
+        Build a trigram index mapping substrings to combo positions
+        
+        Returns:
+            Dictionary of trigram -> set of (category, starter, combo_index)
+        """
+        index: Dict[str, Set[Tuple[str, str, int]]] = {}
+        n = SEARCH_NGRAM_SIZE
+        
+        for category, starters in self._combo_data.items():
+            for starter, starter_data in starters.items():
+                for i, combo in enumerate(starter_data.get("combos", [])):
+                    text = f"{combo.get('notation', '').lower()}\0{combo.get('notes', '').lower()}"
+                    position = (category, starter, i)
+                    for gram in {text[j:j + n] for j in range(len(text) - n + 1)}:
+                        index.setdefault(gram, set()).add(position)
+        
+        logger.debug(f"Built combo search index with {len(index)} trigrams")
+        return index
+    
+    def find_combo_candidates(self, search_term: str) -> Optional[Dict[Tuple[str, str], Set[int]]]:
+        """
+        Narrow a search to combos that contain every trigram of the term
+        
+        Candidates still need a substring check, since sharing trigrams
+        does not guarantee the whole term matches.
+        
+        Args:
+            search_term: Lowercased search term
+            
+        Returns:
+            Dictionary of (category, starter) -> candidate combo indices,
+            or None if the term is too short to use the index
+        """
+        n = SEARCH_NGRAM_SIZE
+        if len(search_term) < n:
+            return None
+        
+        if self._search_index is None:
+            self._search_index = self._build_search_index()
+        
+        grams = {search_term[j:j + n] for j in range(len(search_term) - n + 1)}
+        postings = sorted(
+            (self._search_index.get(gram, set()) for gram in grams),
+            key=len
+        )
+        positions = set(postings[0]).intersection(*postings[1:])
+        
+        candidates: Dict[Tuple[str, str], Set[int]] = {}
+        for category, starter, i in positions:
+            candidates.setdefault((category, starter), set()).add(i)
+        return candidates
     
     async def cleanup(self) -> None:
         """Cleanup method to ensure data is saved on shutdown"""
@@ -0,0 +1,13 @@
+"""
+Shared test setup for Combot
+"""
+
+import os
+import sys
+
+# config.py validates the environment at import time; tests never talk to Discord or YouTube
+os.environ.setdefault("DISCORD_BOT_TOKEN", "test-token")
+os.environ.setdefault("YOUTUBE_API_KEY", "test-key")
+
+# Modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,44 @@
+"""
+Tests for URL validation
+"""
+
+import pytest
+
+from utils import validate_url
+
+
+@pytest.mark.parametrize("url", [
+    "https://example.com",
+    "http://example.com/",
+    "HTTPS://Example.COM/path?query=1",
+    "https://sub.domain.co.uk/path",
+    "https://example.com.",
+    "http://localhost:8080/admin",
+    "http://127.0.0.1",
+    " https://example.com/padded ",
+])
+def test_valid_urls(url):
+    assert validate_url(url)
+
+
+@pytest.mark.parametrize("url", [
+    "",
+    None,
+    "example.com",
+    "ftp://example.com",
+    # Hosts without real labels
+    "http://...",
+    "http://.com",
+    "http://example",
+    "http://exa_mple.com",
+    "https://",
+    # Whitespace, credentials and bad ports
+    "http://exa mple.com",
+    "https://example.com/a b",
+    "http://user@example.com",
+    "https://example.com:port",
+    "https://example.com:99999",
+    "https://example.com/" + "a" * 2048,
+])
+def test_invalid_urls(url):
+    assert not validate_url(url)
@@ -0,0 +1,52 @@
+"""
+Tests for YouTube video description parsing
+"""
+
+import pytest
+
+pytest.importorskip("discord")
+pytest.importorskip("dotenv")
+pytest.importorskip("googleapiclient")
+
+from youtube import YouTubeService
+
+
+def parse(description: str):
+    return YouTubeService._parse_video_description(description)
+
+
+@pytest.mark.parametrize("description, notation", [
+    ("Notation: 2B, 5C", "2B > 5C"),
+    ("Combo: 2A->5B", "2A >5B"),
+    ("inputs: 236P", "236P"),
+    # Preferred labels win wherever they appear
+    ("Inputs: 5A\nCombo: 2B\nNotation: 5C", "5C"),
+    # A lower-priority label must not swallow a higher-priority one
+    ("Combo:\nNotation: 2B > 5C", "2B > 5C"),
+    ("combo: 5A, notation: 2B", "2B"),
+    # A label with no value counts as missing
+    ("notation:", "Unknown Notation"),
+    ("notation: \t", "Unknown Notation"),
+    ("", "Unknown Notation"),
+    ("no labels here", "Unknown Notation"),
+])
+def test_notation(description, notation):
+    assert parse(description)["notation"] == notation
+
+
+@pytest.mark.parametrize("description, notes", [
+    ("Notes: corner only", "corner only"),
+    ("Tip: delay the last hit", "delay the last hit"),
+    ("comments: meter", "meter"),
+    ("Tip: x notes: y", "y"),
+    ("Tips: t\nNote: n", "n"),
+    ("", "No Notes Provided"),
+])
+def test_notes(description, notes):
+    assert parse(description)["notes"] == notes
+
+
+def test_values_are_limited_to_first_line():
+    parsed = parse("Notation: 5A\nmore text\nNotes: first\nsecond")
+    assert parsed["notation"] == "5A"
+    assert parsed["notes"] == "first"
@@ -3,17 +3,47 @@ Utility functions and decorators for Combot
 Includes improved caching and helper functions
 """
 
+import re
 import time
 import pickle
 import hashlib
 import logging
-from functools import wraps
+from collections import OrderedDict
+from functools import lru_cache, wraps
 from typing import Any, Callable, Dict, Optional
+from urllib.parse import ParseResult, urlparse
 
 logger = logging.getLogger(__name__)
 
+# Characters that are unsafe in filenames, mapped to underscores
+_FILENAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
 
-def async_ttl_cache(seconds: int = 300):
+# Combo notation separators normalized to " > " in a single pass
+_COMBO_SEP_RE = re.compile(r',|->|→')
+
+# Sentinel for missing keys in nested lookups
+_MISSING = object()
+
+# Accepted URL schemes
+_URL_SCHEMES = ('http://', 'https://')
+
+# URL host: dotted domain name, localhost or IPv4 address, with an optional port
+_URL_NETLOC_RE = re.compile(
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?',  # optional port
+    re.IGNORECASE
+)
+
+# Longest URL worth parsing; modal inputs cap at 500 but clients can send more
+_MAX_URL_LENGTH = 2048
+
+# Uppercase hex digits accepted in color values
+_HEX_DIGITS = frozenset('0123456789ABCDEF')
+
+
+def async_ttl_cache(seconds: int = 300, maxsize: Optional[int] = 128):
     """
     Async cache decorator with time-to-live and robust key generation
     
@@ -22,13 +52,23 @@ def async_ttl_cache(seconds: int = 300):
     - Handles unhashable arguments properly
     - Better error handling and logging
     - Automatic cleanup of expired entries
+    - LRU eviction once the cache holds maxsize entries
     
     Args:
         seconds: Cache TTL in seconds
+        maxsize: Maximum cached entries (None for unbounded)
     """
     def decorator(func: Callable) -> Callable:
-        cache: Dict[str, Any] = {}
+        cache: "OrderedDict[str, Any]" = OrderedDict()
         cache_times: Dict[str, float] = {}
+        last_cleanup = [0.0]
+        cleanup_interval = seconds / 10
+        
+        # Bind hot-path globals once so the wrapper reads closure cells
+        dumps = pickle.dumps
+        protocol = pickle.HIGHEST_PROTOCOL
+        md5 = hashlib.md5
+        clock = time.time
         
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -36,33 +76,42 @@ def async_ttl_cache(seconds: int = 300):
             try:
                 # Use pickle for reliable serialization of complex objects
                 key_data = (args, tuple(sorted(kwargs.items())))
-                key_bytes = pickle.dumps(key_data)
+                key_bytes = dumps(key_data, protocol=protocol)
                 # Use hash for consistent string key
-                cache_key = hashlib.md5(key_bytes).hexdigest()
+                cache_key = md5(key_bytes).hexdigest()
             except Exception as e:
                 # Fallback to string representation if pickle fails
                 logger.warning(f"Cache key generation failed, using fallback: {e}")
                 cache_key = f"{str(args)}:{str(sorted(kwargs.items()))}"
             
-            now = time.time()
+            now = clock()
             
             # Check if cached and not expired
             if cache_key in cache and now - cache_times.get(cache_key, 0) < seconds:
                 logger.debug(f"Cache hit for {func.__name__}")
+                cache.move_to_end(cache_key)
                 return cache[cache_key]
             
             # Call function and cache result
             try:
                 result = await func(*args, **kwargs)
                 cache[cache_key] = result
+                cache.move_to_end(cache_key)
                 cache_times[cache_key] = now
                 logger.debug(f"Cache miss for {func.__name__}, result cached")
+                
+                # Evict least recently used entries over the size bound
+                if maxsize is not None:
+                    while len(cache) > maxsize:
+                        evicted_key, _ = cache.popitem(last=False)
+                        cache_times.pop(evicted_key, None)
             except Exception as e:
                 logger.error(f"Error in cached function {func.__name__}: {e}")
                 raise
             
-            # Periodic cleanup of expired entries (every 10 calls)
-            if len(cache) > 0 and len(cache) % 10 == 0:
+            # Periodic cleanup of expired entries (at most every tenth of the TTL)
+            if now - last_cleanup[0] >= cleanup_interval:
+                last_cleanup[0] = now
                 expired_keys = [
                     k for k, t in cache_times.items() 
                     if now - t >= seconds
@@ -90,7 +139,8 @@ def async_ttl_cache(seconds: int = 300):
                 'total': len(cache),
                 'expired': expired,
                 'active': len(cache) - expired,
-                'ttl_seconds': seconds
+                'ttl_seconds': seconds,
+                'maxsize': maxsize
             }
         
         # Attach utility methods
@@ -101,34 +151,53 @@ def async_ttl_cache(seconds: int = 300):
     return decorator
 
 
-def validate_url(url: str) -> bool:
+def validate_url_parsed(url: str) -> Optional[ParseResult]:
     """
-    Validate URL format more robustly
+    Validate URL format and return the parsed result
     
     Args:
         url: URL string to validate
         
     Returns:
-        True if URL appears valid, False otherwise
+        ParseResult if URL appears valid, None otherwise
     """
-    if not url or not isinstance(url, str):
-        return False
+    if not url or not isinstance(url, str) or len(url) > _MAX_URL_LENGTH:
+        return None
     
     url = url.strip()
-    if not url:
-        return False
     
-    # Basic URL pattern validation
-    import re
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    
-    return bool(url_pattern.match(url))
+    # Cheap prefix check before parsing
+    if not url[:8].lower().startswith(_URL_SCHEMES):
+        return None
+    
+    # URLs can't contain whitespace
+    if len(url.split(None, 1)) > 1:
+        return None
+    
+    try:
+        parsed = urlparse(url)
+        parsed.port  # Raises ValueError for a malformed port
+    except ValueError:
+        return None
+    
+    # Whole netloc must be a real host, so "http://..." or "http://user@host" fail
+    if not _URL_NETLOC_RE.fullmatch(parsed.netloc):
+        return None
+    
+    return parsed
+
+
+def validate_url(url: str) -> bool:
+    """
+    Validate URL format more robustly
+    
+    Args:
+        url: URL string to validate
+        
+    Returns:
+        True if URL appears valid, False otherwise
+    """
+    return validate_url_parsed(url) is not None
 
 
 def validate_discord_color_hex(color_hex: str) -> Optional[str]:
@@ -148,9 +217,8 @@ def validate_discord_color_hex(color_hex: str) -> Optional[str]:
     color_hex = color_hex.strip().upper()
     color_hex = color_hex.replace("#", "").replace("0X", "")
     
-    # Validate hex format
-    import re
-    if not re.match(r'^[0-9A-F]{6}$', color_hex):
+    # Validate hex format: exactly six digits (int(x, 16) would also accept "_", "+" and spaces)
+    if len(color_hex) != 6 or not _HEX_DIGITS.issuperset(color_hex):
         return None
     
     return f"0x{color_hex}"
@@ -171,10 +239,12 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     if not text or len(text) <= max_length:
         return text
     
-    if len(suffix) >= max_length:
-        return text[:max_length]
+    # Always end with (part of) the suffix so truncation stays visible
+    keep = max_length - len(suffix)
+    if keep <= 0:
+        return suffix[:max_length]
     
-    return text[:max_length - len(suffix)] + suffix
+    return text[:keep] + suffix
 
 
 def safe_get_nested(data: Dict, keys: list, default: Any = None) -> Any:
@@ -189,12 +259,18 @@ def safe_get_nested(data: Dict, keys: list, default: Any = None) -> Any:
     Returns:
         Value at key path or default
     """
-    try:
-        for key in keys:
+    for key in keys:
+        if isinstance(data, dict):
+            data = data.get(key, _MISSING)
+            if data is _MISSING:
+                return default
+        elif isinstance(data, (list, tuple)) and isinstance(key, int):
+            if not -len(data) <= key < len(data):
+                return default
             data = data[key]
-        return data
-    except (KeyError, TypeError, AttributeError):
-        return default
+        else:
+            return default
+    return data
 
 
 def chunk_list(items: list, chunk_size: int) -> list:
@@ -214,6 +290,7 @@ def chunk_list(items: list, chunk_size: int) -> list:
     return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
 
 
+@lru_cache(maxsize=4096)
 def format_combo_notation(notation: str) -> str:
     """
     Format combo notation for display
@@ -228,11 +305,7 @@ def format_combo_notation(notation: str) -> str:
         return "Unknown Notation"
     
     # Replace common separators with more readable format
-    formatted = notation.replace(",", " > ")
-    formatted = formatted.replace("->", " > ")
-    formatted = formatted.replace("→", " > ")
-    
-    return formatted.strip()
+    return _COMBO_SEP_RE.sub(" > ", notation).strip()
 
 
 def sanitize_filename(filename: str) -> str:
@@ -245,13 +318,11 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    import re
-    
     # Remove/replace unsafe characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    sanitized = filename.translate(_FILENAME_TRANS)
     
     # Remove excessive whitespace
-    sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+    sanitized = ' '.join(sanitized.split())
     
     # Ensure not empty
     if not sanitized:
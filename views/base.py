@@ -3,8 +3,10 @@ Base view classes for Discord UI components
 Provides common functionality and improved error handling
 """
 
+import asyncio
+import inspect
 import logging
-from typing import Any, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import discord
 from discord.ui import View, Button
@@ -37,8 +39,11 @@ class BaseView(View):
         """
         super().__init__(timeout=timeout)
         self.user = user
+        # Set by whoever sends or edits a message with this view; discord.py doesn't
+        # track it, and on_timeout needs it to clear the expired menu
         self.message: Optional[discord.Message] = None
         self._is_finished = False
+        self._timeout_task: Optional[asyncio.Task] = None
     
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """
@@ -75,22 +80,27 @@ class BaseView(View):
         self._is_finished = True
         
         if self.message:
-            try:
-                # Try to edit the message to show timeout
-                await self.message.edit(
-                    content="⏰ *This menu has timed out and is no longer active.*",
-                    view=None,
-                    embed=None
-                )
-                logger.debug(f"View timed out for user {self.user.id}")
-            except discord.NotFound:
-                # Message was deleted
-                pass
-            except discord.Forbidden:
-                # No permission to edit
-                logger.warning("No permission to edit timed out message")
-            except Exception as e:
-                logger.error(f"Error handling view timeout: {e}")
+            # Edit in the background so a slow or rate-limited edit doesn't
+            # hold up timeout handling for other views
+            self._timeout_task = asyncio.create_task(self._edit_on_timeout())
+    
+    async def _edit_on_timeout(self) -> None:
+        """Edit the message to show the view has timed out"""
+        try:
+            await self.message.edit(
+                content="⏰ *This menu has timed out and is no longer active.*",
+                view=None,
+                embed=None
+            )
+            logger.debug(f"View timed out for user {self.user.id}")
+        except discord.NotFound:
+            # Message was deleted
+            pass
+        except discord.Forbidden:
+            # No permission to edit
+            logger.warning("No permission to edit timed out message")
+        except Exception as e:
+            logger.error(f"Error handling view timeout: {e}")
     
     async def on_error(self, interaction: discord.Interaction, error: Exception, item: discord.ui.Item) -> None:
         """
@@ -121,6 +131,22 @@ class BaseView(View):
         except Exception as follow_error:
             logger.error(f"Failed to send error message: {follow_error}")
     
+    async def _send_error(self, interaction: discord.Interaction, message: str) -> None:
+        """
+        Send an ephemeral error message without responding to an interaction twice
+        
+        Args:
+            interaction: Discord interaction to respond to
+            message: Error message to send
+        """
+        try:
+            if not interaction.response.is_done():
+                await interaction.response.send_message(message, ephemeral=True)
+            else:
+                await interaction.followup.send(message, ephemeral=True)
+        except Exception as e:
+            logger.error(f"Failed to send error message: {e}")
+    
     def stop(self) -> None:
         """Stop the view and mark as finished"""
         self._is_finished = True
@@ -135,6 +161,7 @@ class PaginatedView(BaseView):
     - Automatic pagination calculation
     - Navigation button management
     - Flexible page item addition
+    - Per-page render data cached across page flips
     - Error handling for page operations
     """
     
@@ -150,9 +177,14 @@ class PaginatedView(BaseView):
             timeout: View timeout in seconds
         """
         super().__init__(user, timeout)
-        self.items = items or []
+        # Share the caller's list (even when empty) so later additions show up on re-render
+        self.items = items if items is not None else []
         self.per_page = max(1, per_page)  # Ensure at least 1 item per page
         self.current_page = 0
+        self._page_render_cache: Dict[int, List[Any]] = {}
+        self._current_items: List[Any] = []
+        self._current_items_page: Optional[int] = None
+        self._page_bounds: Dict[tuple, Tuple[int, int, int]] = {}
     
     @property
     def max_pages(self) -> int:
@@ -163,13 +195,37 @@ class PaginatedView(BaseView):
     
     @property
     def current_items(self) -> List[Any]:
-        """Get items for current page"""
+        """Get items for current page, sliced once per page"""
         if not self.items:
             return []
         
-        start = self.current_page * self.per_page
-        end = start + self.per_page
-        return self.items[start:end]
+        # Re-slice only when the page changes; item changes go through invalidate_page_render
+        if self.current_page != self._current_items_page:
+            start = self.current_page * self.per_page
+            self._current_items = self.items[start:start + self.per_page]
+            self._current_items_page = self.current_page
+        return self._current_items
+    
+    @property
+    def page_start(self) -> int:
+        """Get the global index of the first item on the current page"""
+        return self.current_page * self.per_page
+    
+    def page_bounds(self) -> Tuple[int, int, int]:
+        """
+        Get bounds for the current page, computed once per page
+        
+        Returns:
+            Tuple of (start, end, total) with start inclusive and end exclusive
+        """
+        total = len(self.items)
+        key = (self.current_page, total)
+        bounds = self._page_bounds.get(key)
+        if bounds is None:
+            start = self.current_page * self.per_page
+            bounds = (start, min(start + self.per_page, total), total)
+            self._page_bounds[key] = bounds
+        return bounds
     
     def update_buttons(self) -> None:
         """Update navigation buttons based on current page"""
@@ -194,6 +250,24 @@ class PaginatedView(BaseView):
         """Override this method to add page-specific buttons"""
         pass
     
+    def get_page_render(self) -> List[Any]:
+        """Get render data for the current page, building it once per page"""
+        render = self._page_render_cache.get(self.current_page)
+        if render is None:
+            render = self._build_page_render(self.current_page)
+            self._page_render_cache[self.current_page] = render
+        return render
+    
+    def _build_page_render(self, page: int) -> List[Any]:
+        """Override this method to precompute per-item render data for a page"""
+        return []
+    
+    def invalidate_page_render(self) -> None:
+        """Drop cached render data after the items change"""
+        self._page_render_cache.clear()
+        self._page_bounds.clear()
+        self._current_items_page = None
+    
     def _add_navigation_buttons(self) -> None:
         """Add previous/next navigation buttons"""
         if self.max_pages <= 1:
@@ -237,7 +311,7 @@ class PaginatedView(BaseView):
             
             if self.current_page != old_page:
                 self.update_buttons()
-                embed = await self.create_embed()
+                embed = await self.render_embed()
                 await interaction.response.edit_message(embed=embed, view=self)
             else:
                 await interaction.response.defer()
@@ -254,7 +328,7 @@ class PaginatedView(BaseView):
             
             if self.current_page != old_page:
                 self.update_buttons()
-                embed = await self.create_embed()
+                embed = await self.render_embed()
                 await interaction.response.edit_message(embed=embed, view=self)
             else:
                 await interaction.response.defer()
@@ -289,18 +363,24 @@ class PaginatedView(BaseView):
             logger.error(f"Failed to send navigation error message")
     
     async def create_embed(self) -> discord.Embed:
-        """Override this method to create the embed for current page"""
+        """Override this method to create the embed for current page; plain def overrides are fine"""
         raise NotImplementedError("Subclasses must implement create_embed method")
     
+    async def render_embed(self) -> discord.Embed:
+        """Get the current page embed, whether create_embed is sync or async"""
+        embed = self.create_embed()
+        if inspect.isawaitable(embed):
+            embed = await embed
+        return embed
+    
     def get_page_info(self) -> str:
         """Get formatted page information string"""
         if not self.items:
             return "No items"
         
-        start = self.current_page * self.per_page + 1
-        end = min((self.current_page + 1) * self.per_page, len(self.items))
+        start, end, total = self.page_bounds()
         
-        return f"Showing {start}-{end} of {len(self.items)}"
+        return f"Showing {start + 1}-{end} of {total}"
     
     def set_page(self, page: int) -> bool:
         """
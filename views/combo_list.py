@@ -2,14 +2,16 @@
 Combo list view for displaying combos within a starter
 """
 
+import asyncio
 import logging
-from typing import List, TYPE_CHECKING
+from typing import Any, AsyncIterator, Dict, List, Optional, TYPE_CHECKING
 
 import discord
 from discord.ui import Button
 
 from views.base import PaginatedView, BaseView
-from utils import truncate_text, format_combo_notation
+from utils import truncate_text
+from config import MAX_EMBED_FIELD_VALUE_LENGTH, MAX_EMBED_TOTAL_LENGTH, MAX_MESSAGE_LENGTH
 
 if TYPE_CHECKING:
     from data import DataManager, ComboEntry
@@ -17,6 +19,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Static error embeds, built once; failing create_embed calls return copies so callers can't alter them
+_ERROR_EMBED_MGMT = discord.Embed(
+    title="❌ Error",
+    description="Failed to load combo management interface.",
+    color=discord.Color.red()
+)
+_ERROR_EMBED_SEARCH = discord.Embed(
+    title="❌ Search Error",
+    description="Failed to display search results.",
+    color=discord.Color.red()
+)
+
 
 class ComboListView(PaginatedView):
     """
@@ -45,66 +59,110 @@ class ComboListView(PaginatedView):
         self.config = config
         self.category = category
         self.starter = starter
+        self._error_embed: Optional[discord.Embed] = None
+        
+        # One button per page slot, relabelled on each page flip
+        self._button_pool = [
+            Button(style=discord.ButtonStyle.primary) for _ in range(self.per_page)
+        ]
+        for btn in self._button_pool:
+            btn.callback = self._on_combo_selected
         self.update_buttons()
     
+    def _build_page_render(self, page: int) -> List[Dict[str, Any]]:
+        """Format button labels and embed fields for a page of combos"""
+        render = []
+        append = render.append
+        trunc = truncate_text
+        start = page * self.per_page
+        
+        # Single notes limit that also keeps the field value under Discord's cap
+        notes_limit = min(150, MAX_EMBED_FIELD_VALUE_LENGTH - len("**Note:** "))
+        
+        for global_index, combo in enumerate(self.items[start:start + self.per_page], start):
+            # Format and truncate notation for field name
+            formatted_notation = combo.formatted_notation
+            if len(formatted_notation) > 200:
+                formatted_notation = trunc(formatted_notation, 200)
+            
+            # Create field value with notes
+            field_value = (
+                f"**Note:** {combo.notes if len(combo.notes) <= notes_limit else trunc(combo.notes, notes_limit)}"
+                if combo.has_notes else "_No specific notes._"
+            )
+            
+            append({
+                'index': global_index,
+                'combo': combo,
+                'button_label': str(global_index + 1),
+                'field_name': f"{global_index + 1}. {formatted_notation}",
+                'field_value': field_value
+            })
+        
+        return render
+    
     def _add_page_items(self) -> None:
         """Add combo number buttons for current page"""
         try:
-            for i, combo in enumerate(self.current_items):
-                global_index = self.current_page * self.per_page + i
-                
-                btn = Button(
-                    label=str(global_index + 1),
-                    style=discord.ButtonStyle.primary,
-                    custom_id=f"combo_{global_index}"
-                )
-                btn.callback = self._make_combo_callback(global_index, combo)
-                self.add_item(btn)
+            add_item = self.add_item
+            
+            for btn, entry in zip(self._button_pool, self.get_page_render()):
+                btn.label = entry['button_label']
+                btn.custom_id = f"combo_{entry['index']}"
+                add_item(btn)
                 
         except Exception as e:
             logger.error(f"Error adding combo buttons: {e}")
     
-    def _make_combo_callback(self, index: int, combo: 'ComboEntry'):
-        """Create callback for combo detail button"""
-        async def callback(interaction: discord.Interaction):
-            try:
-                # Create detailed combo message
-                content = f"**Combo #{index + 1} for {self.starter}**\n\n"
-                
-                # Add notation with formatting
-                formatted_notation = format_combo_notation(combo.notation)
-                # Truncate if too long for code block
-                if len(formatted_notation) > 800:
-                    formatted_notation = truncate_text(formatted_notation, 800)
-                
-                content += f"**Notation:**\n```{formatted_notation}```\n"
-                
-                # Add notes if available and meaningful
-                if combo.notes and combo.notes.strip() and combo.notes != "No Notes Provided":
-                    notes_text = truncate_text(combo.notes, 800)
-                    content += f"**Notes:**\n{notes_text}\n"
-                
-                # Add video link
-                content += f"\n🎥 **Video:** {combo.link}"
-                
-                # Ensure total content length is within Discord limits
-                if len(content) > 2000:
-                    content = truncate_text(content, 1997)  # Leave room for "..."
-                
-                await interaction.response.send_message(
-                    content=content,
-                    ephemeral=True,
-                    suppress_embeds=False  # Allow video embeds
-                )
-                
-            except Exception as e:
-                logger.error(f"Error showing combo details: {e}")
-                await interaction.response.send_message(
-                    f"❌ Failed to load details for combo #{index + 1}. Please try again.",
-                    ephemeral=True
-                )
+    async def _on_combo_selected(self, interaction: discord.Interaction) -> None:
+        """Show details for the combo whose button was pressed"""
+        # Buttons carry the combo index in their custom_id ("combo_<index>")
+        index = int(interaction.data["custom_id"].rsplit("_", 1)[-1])
+        combo = self.items[index]
         
-        return callback
+        try:
+            # Create detailed combo message
+            sections = [f"**Combo #{index + 1} for {self.starter}**\n\n"]
+            
+            # Add notation with formatting
+            formatted_notation = combo.formatted_notation
+            # Truncate if too long for code block
+            if len(formatted_notation) > 800:
+                formatted_notation = truncate_text(formatted_notation, 800)
+            
+            sections.append(f"**Notation:**\n```{formatted_notation}```\n")
+            
+            # Add notes if available and meaningful
+            if combo.has_notes:
+                notes_text = truncate_text(combo.notes, 800)
+                sections.append(f"**Notes:**\n{notes_text}\n")
+            
+            # Add video link
+            sections.append(f"\n🎥 **Video:** {combo.link}")
+            
+            # Stay within Discord's message limit, stopping at the first section that overflows
+            parts = []
+            remaining = MAX_MESSAGE_LENGTH
+            for section in sections:
+                if len(section) > remaining:
+                    parts.append(truncate_text(section, remaining))
+                    break
+                parts.append(section)
+                remaining -= len(section)
+            content = "".join(parts)
+            
+            await interaction.response.send_message(
+                content=content,
+                ephemeral=True,
+                suppress_embeds=False  # Allow video embeds
+            )
+            
+        except Exception as e:
+            logger.error(f"Error showing combo details: {e}")
+            await interaction.response.send_message(
+                f"❌ Failed to load details for combo #{index + 1}. Please try again.",
+                ephemeral=True
+            )
     
     async def _go_back(self, interaction: discord.Interaction) -> None:
         """Close combo list (as it's ephemeral)"""
@@ -135,45 +193,36 @@ class ComboListView(PaginatedView):
             )
             embed.set_thumbnail(url=self.config.thumbnail_url)
             
-            # Add combo fields for current page
-            for i, combo in enumerate(self.current_items):
-                global_index = self.current_page * self.per_page + i
-                
-                # Format and truncate notation for field name
-                formatted_notation = format_combo_notation(combo.notation)
-                field_name = f"{global_index + 1}. {truncate_text(formatted_notation, 200)}"
-                
-                # Create field value with notes
-                field_value = "_No specific notes._"
-                if combo.notes and combo.notes.strip() and combo.notes != "No Notes Provided":
-                    notes_preview = truncate_text(combo.notes, 150)
-                    field_value = f"**Note:** {notes_preview}"
-                
-                # Ensure field value isn't too long
-                if len(field_value) > 1000:
-                    field_value = truncate_text(field_value, 997)
-                
+            # Add footer with combo range info
+            start, end, total = self.page_bounds()
+            footer = f"Showing combos {start + 1}-{end} of {total} • Category: {self.category}"
+            embed.set_footer(text=footer)
+            
+            # Add combo fields for current page while the embed stays under Discord's total limit
+            remaining = MAX_EMBED_TOTAL_LENGTH - len(title) - len(embed.description) - len(footer)
+            for entry in self.get_page_render():
+                field_size = len(entry['field_name']) + len(entry['field_value'])
+                if field_size > remaining:
+                    break
                 embed.add_field(
-                    name=field_name,
-                    value=field_value,
+                    name=entry['field_name'],
+                    value=entry['field_value'],
                     inline=False
                 )
-            
-            # Add footer with combo range info
-            start = self.current_page * self.per_page + 1
-            end = min((self.current_page + 1) * self.per_page, len(self.items))
-            embed.set_footer(text=f"Showing combos {start}-{end} of {len(self.items)} • Category: {self.category}")
+                remaining -= field_size
             
             return embed
             
         except Exception as e:
             logger.error(f"Error creating combo list embed: {e}")
-            # Return a basic error embed
-            return discord.Embed(
-                title=f"❌ Error Loading {self.starter} Combos",
-                description="Failed to load combo list. Please try again.",
-                color=discord.Color.red()
-            )
+            # Return a copy of a basic error embed, built once per view
+            if self._error_embed is None:
+                self._error_embed = discord.Embed(
+                    title=f"❌ Error Loading {self.starter} Combos",
+                    description="Failed to load combo list. Please try again.",
+                    color=discord.Color.red()
+                )
+            return self._error_embed.copy()
 
 
 class ComboManagementView(PaginatedView):
@@ -202,53 +251,78 @@ class ComboManagementView(PaginatedView):
         
         super().__init__(user, combos, 5, config.view_timeout_seconds)
         self.config = config
+        
+        # One button per page slot, relabelled on each page flip
+        self._button_pool = [
+            Button(style=discord.ButtonStyle.secondary) for _ in range(self.per_page)
+        ]
+        for btn in self._button_pool:
+            btn.callback = self._on_combo_selected
         self.update_buttons()
     
+    def _build_page_render(self, page: int) -> List[Dict[str, Any]]:
+        """Format management button labels for a page of combos"""
+        render = []
+        start = page * self.per_page
+        
+        for global_index, combo in enumerate(self.items[start:start + self.per_page], start):
+            # Truncate notation for button display
+            notation_preview = combo.formatted_notation
+            if len(notation_preview) > 40:
+                notation_preview = truncate_text(notation_preview, 40)
+            
+            render.append({
+                'index': global_index,
+                'combo': combo,
+                'button_label': f"📝 {global_index + 1}. {notation_preview}"
+            })
+        
+        return render
+    
     def _add_page_items(self) -> None:
         """Add combo management buttons"""
         try:
-            for i, combo in enumerate(self.current_items):
-                global_index = self.current_page * self.per_page + i
-                
-                # Truncate notation for button display
-                notation_preview = truncate_text(format_combo_notation(combo.notation), 40)
-                
-                btn = Button(
-                    label=f"📝 {global_index + 1}. {notation_preview}",
-                    style=discord.ButtonStyle.secondary,
-                    custom_id=f"edit_combo_{global_index}"
-                )
-                btn.callback = self._make_edit_callback(global_index, combo)
-                self.add_item(btn)
+            add_item = self.add_item
+            
+            for btn, entry in zip(self._button_pool, self.get_page_render()):
+                btn.label = entry['button_label']
+                btn.custom_id = f"edit_combo_{entry['index']}"
+                add_item(btn)
                 
         except Exception as e:
             logger.error(f"Error adding combo management buttons: {e}")
     
-    def _make_edit_callback(self, index: int, combo: 'ComboEntry'):
-        """Create callback for combo editing"""
-        async def callback(interaction: discord.Interaction):
-            try:
-                # For now, just show combo details
-                # In the future, this could open an edit modal
-                content = f"**Combo #{index + 1} Management**\n\n"
-                content += f"**Notation:** {combo.notation}\n"
-                content += f"**Notes:** {combo.notes}\n"
-                content += f"**Link:** {combo.link}\n\n"
-                content += "_Combo editing via modal will be implemented in a future update._"
-                
-                await interaction.response.send_message(
-                    content=truncate_text(content, 2000),
-                    ephemeral=True
-                )
-                
-            except Exception as e:
-                logger.error(f"Error in combo edit callback: {e}")
-                await interaction.response.send_message(
-                    "❌ Failed to load combo for editing.",
-                    ephemeral=True
-                )
+    async def _on_combo_selected(self, interaction: discord.Interaction) -> None:
+        """Show management details for the combo whose button was pressed"""
+        # Buttons carry the combo index in their custom_id ("edit_combo_<index>")
+        index = int(interaction.data["custom_id"].rsplit("_", 1)[-1])
+        combo = self.items[index]
         
-        return callback
+        try:
+            # For now, just show combo details
+            # In the future, this could open an edit modal
+            content = "".join((
+                f"**Combo #{index + 1} Management**\n\n",
+                f"**Notation:** {combo.notation}\n",
+                f"**Notes:** {combo.notes}\n",
+                f"**Link:** {combo.link}\n\n",
+                "_Combo editing via modal will be implemented in a future update._"
+            ))
+            
+            if len(content) > MAX_MESSAGE_LENGTH:
+                content = truncate_text(content, MAX_MESSAGE_LENGTH)
+            
+            await interaction.response.send_message(
+                content=content,
+                ephemeral=True
+            )
+            
+        except Exception as e:
+            logger.error(f"Error in combo edit callback: {e}")
+            await interaction.response.send_message(
+                "❌ Failed to load combo for editing.",
+                ephemeral=True
+            )
     
     async def create_embed(self) -> discord.Embed:
         """Create combo management embed"""
@@ -282,11 +356,7 @@ class ComboManagementView(PaginatedView):
             
         except Exception as e:
             logger.error(f"Error creating combo management embed: {e}")
-            return discord.Embed(
-                title="❌ Error",
-                description="Failed to load combo management interface.",
-                color=discord.Color.red()
-            )
+            return _ERROR_EMBED_MGMT.copy()
 
 
 class ComboSearchView(BaseView):
@@ -294,8 +364,11 @@ class ComboSearchView(BaseView):
     View for searching combos across all categories and starters
     """
     
+    # Number of results shown in the embed
+    DISPLAY_LIMIT = 10
+    
     def __init__(self, user: discord.User, config: 'BotConfiguration',
-                 data_manager: 'DataManager', search_term: str):
+                 data_manager: 'DataManager', search_term: str, max_results: int = 50):
         """
         Initialize combo search view
         
@@ -304,12 +377,17 @@ class ComboSearchView(BaseView):
             config: Bot configuration
             data_manager: DataManager instance
             search_term: Term to search for in combo notations and notes
+            max_results: Stop searching once this many matches are found
         """
         super().__init__(user, config.view_timeout_seconds)
         self.config = config
         self.data_manager = data_manager
         self.search_term = search_term.lower()
+        self._search_bytes = self.search_term.encode("utf-8")
+        self.max_results = max(1, max_results)
         self.results = []
+        self.total_results = 0
+        self.results_capped = False
         
         # Add close button
         close_btn = Button(
@@ -319,32 +397,77 @@ class ComboSearchView(BaseView):
         close_btn.callback = self._close
         self.add_item(close_btn)
     
+    async def _iter_results(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield combos matching the search term in category/starter order"""
+        search_bytes = self._search_bytes
+        
+        # Index lookup narrows the scan; None means scan everything
+        candidates = self.data_manager.find_combo_candidates(self.search_term)
+        
+        pairs = [
+            (category, starter)
+            for category in self.config.combo_categories
+            for starter in self.config.starters.get(category, [])
+            if candidates is None or candidates.get((category, starter))
+        ]
+        
+        # Load all starters' combos concurrently
+        all_combos = await asyncio.gather(
+            *(self.data_manager.get_combos(category, starter) for category, starter in pairs)
+        )
+        
+        for (category, starter), combos in zip(pairs, all_combos):
+            if candidates is not None:
+                positions = [i for i in sorted(candidates[(category, starter)]) if i < len(combos)]
+            else:
+                positions = range(len(combos))
+            
+            for i in positions:
+                combo = combos[i]
+                # Search notation and notes in one byte-level scan
+                if search_bytes in combo.search_bytes:
+                    yield {
+                        'category': category,
+                        'starter': starter,
+                        'combo_index': i + 1,
+                        'combo': combo
+                    }
+    
     async def search_combos(self) -> None:
         """Search for combos matching the search term"""
         try:
             self.results = []
+            self.total_results = 0
+            self.results_capped = False
             
-            for category in self.config.combo_categories:
-                starters = self.config.starters.get(category, [])
+            # Only the displayed results are kept; the rest are just counted
+            async for result in self._iter_results():
+                # A match past the cap only marks the search as capped
+                if self.total_results >= self.max_results:
+                    self.results_capped = True
+                    break
                 
-                for starter in starters:
-                    combos = await self.data_manager.get_combos(category, starter)
-                    
-                    for i, combo in enumerate(combos):
-                        # Search in notation and notes
-                        if (self.search_term in combo.notation.lower() or 
-                            self.search_term in combo.notes.lower()):
-                            
-                            self.results.append({
-                                'category': category,
-                                'starter': starter,
-                                'combo_index': i + 1,
-                                'combo': combo
-                            })
+                if self.total_results < self.DISPLAY_LIMIT:
+                    self.results.append(result)
+                self.total_results += 1
             
         except Exception as e:
             logger.error(f"Error searching combos: {e}")
     
+    @staticmethod
+    def _format_result_value(result: Dict[str, Any]) -> str:
+        """Format the embed field value for a single search result"""
+        combo = result['combo']
+        notation = combo.formatted_notation
+        if len(notation) > 100:
+            notation = truncate_text(notation, 100)
+        
+        if not combo.has_notes:
+            return f"**Combo #{result['combo_index']}:** {notation}"
+        
+        notes = combo.notes if len(combo.notes) <= 100 else truncate_text(combo.notes, 100)
+        return f"**Combo #{result['combo_index']}:** {notation}\n*{notes}*"
+    
     async def _close(self, interaction: discord.Interaction) -> None:
         """Close search results"""
         self.stop()
@@ -362,38 +485,28 @@ class ComboSearchView(BaseView):
                 color=self.config.embed_color
             )
             
+            result_count = f"{self.total_results}+" if self.results_capped else str(self.total_results)
+            
             if not self.results:
                 embed.description = f"No combos found matching **{self.search_term}**."
             else:
-                embed.description = f"Found **{len(self.results)}** combos matching **{self.search_term}**:"
+                embed.description = f"Found **{result_count}** combos matching **{self.search_term}**:"
                 
-                # Show first 10 results
-                for i, result in enumerate(self.results[:10]):
-                    combo = result['combo']
-                    notation = truncate_text(format_combo_notation(combo.notation), 100)
-                    
-                    field_name = f"{i + 1}. {result['category']} → {result['starter']}"
-                    field_value = f"**Combo #{result['combo_index']}:** {notation}"
-                    
-                    if combo.notes and combo.notes != "No Notes Provided":
-                        notes = truncate_text(combo.notes, 100)
-                        field_value += f"\n*{notes}*"
-                    
-                    embed.add_field(
-                        name=field_name,
-                        value=field_value,
-                        inline=False
-                    )
+                # Show the retained results
+                rendered = [
+                    (f"{i + 1}. {result['category']} → {result['starter']}", self._format_result_value(result))
+                    for i, result in enumerate(self.results)
+                ]
                 
-                if len(self.results) > 10:
-                    embed.set_footer(text=f"Showing first 10 of {len(self.results)} results")
+                add_field = embed.add_field
+                for name, value in rendered:
+                    add_field(name=name, value=value, inline=False)
+                
+                if self.total_results > self.DISPLAY_LIMIT:
+                    embed.set_footer(text=f"Showing first {self.DISPLAY_LIMIT} of {result_count} results")
             
             return embed
             
         except Exception as e:
             logger.error(f"Error creating search embed: {e}")
-            return discord.Embed(
-                title="❌ Search Error",
-                description="Failed to display search results.",
-                color=discord.Color.red()
-            )
+            return _ERROR_EMBED_SEARCH.copy()
@@ -4,13 +4,16 @@ Central hub for navigating to different bot features
 """
 
 import logging
-from urllib.parse import quote_plus
-from typing import TYPE_CHECKING
+from itertools import cycle
+from typing import Dict, NamedTuple, Optional, Tuple, TYPE_CHECKING
 
 import discord
 from discord.ui import Button
 
 from views.base import BaseView
+from views.player import PlayerListView
+from views.resource import ResourceMenuView
+from views.starter_list import StarterListView
 
 if TYPE_CHECKING:
     from data import DataManager
@@ -18,6 +21,41 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Category button styles, cycled for visual variety
+_CATEGORY_STYLES = (
+    discord.ButtonStyle.primary,
+    discord.ButtonStyle.success,
+    discord.ButtonStyle.secondary
+)
+
+# Fixed main menu buttons after the categories: (predicate, label, style, custom_id, kind)
+_MENU_BUTTON_TABLE = (
+    (lambda c: True, lambda c: "📚 Resources", discord.ButtonStyle.secondary, "resources", "resources"),
+    (lambda c: bool(c.notable_players), lambda c: "✨ Notable Players",
+     discord.ButtonStyle.secondary, "notable_players", "players"),
+    (lambda c: bool(c.info_section_ender_title), lambda c: c.info_section_ender_title,
+     discord.ButtonStyle.secondary, "ender_info", "ender"),
+    (lambda c: bool(c.info_section_routes_title), lambda c: c.info_section_routes_title,
+     discord.ButtonStyle.secondary, "routes_info", "routes"),
+    (lambda c: True, lambda c: "✖️ Close", discord.ButtonStyle.grey, "close", "close")
+)
+
+# Basic main menu embed used when the configured one can't be built
+_FALLBACK_EMBED_DICT = {
+    "title": "🎮 Combo Bot",
+    "description": "Welcome! Use the buttons below to navigate.",
+    "color": discord.Color.blue().value
+}
+
+
+class ButtonSpec(NamedTuple):
+    """Precomputed main menu button attributes"""
+    label: str
+    style: discord.ButtonStyle
+    custom_id: str
+    kind: str
+    category: Optional[str] = None
+
 
 class MainMenuView(BaseView):
     """
@@ -46,157 +84,104 @@ class MainMenuView(BaseView):
     
     def _add_buttons(self) -> None:
         """Add all menu buttons based on configuration"""
-        try:
-            # Add combo category buttons
-            self._add_category_buttons()
-            
-            # Add resource buttons
-            self._add_resource_buttons()
-            
-            # Add info section buttons
-            self._add_info_buttons()
-            
-            # Add utility buttons
-            self._add_utility_buttons()
-            
-        except Exception as e:
-            logger.error(f"Error adding main menu buttons: {e}")
+        dispatch = {
+            "category": self._category_dispatch,
+            "resources": self._show_resources,
+            "players": self._show_notable_players,
+            "ender": self._show_ender_info,
+            "routes": self._show_routes,
+            "close": self._close
+        }
+        
+        for spec in self.config.get_cached("main_menu_buttons", self._build_button_specs):
+            btn = Button(label=spec.label, style=spec.style, custom_id=spec.custom_id)
+            btn.callback = dispatch[spec.kind]
+            self.add_item(btn)
     
-    def _add_category_buttons(self) -> None:
-        """Add buttons for combo categories"""
-        if not self.config.combo_categories:
-            return
+    def _build_button_specs(self) -> Tuple[ButtonSpec, ...]:
+        """Build button specs for the current configuration"""
+        specs = []
         
-        # Button styles cycle for visual variety
-        styles = [
-            discord.ButtonStyle.primary,
-            discord.ButtonStyle.success,
-            discord.ButtonStyle.secondary
-        ]
+        # Combo category buttons, with styles cycling for visual variety
+        config = self.config
+        for category, label, safe_category, style in zip(
+            config.combo_categories, config.combo_category_labels,
+            config.combo_category_ids, cycle(_CATEGORY_STYLES)
+        ):
+            specs.append(ButtonSpec(
+                label=label,
+                style=style,
+                custom_id=f"cat_{safe_category}",
+                kind="category",
+                category=category
+            ))
         
-        for i, category in enumerate(self.config.combo_categories):
-            try:
-                # Validate category name for custom_id
-                safe_category = quote_plus(category)[:90]  # Keep within Discord limits
-                
-                btn = Button(
-                    label=category[:80],  # Discord button label limit
-                    style=styles[i % len(styles)],
-                    custom_id=f"cat_{safe_category}"
-                )
-                btn.callback = self._make_category_callback(category)
-                self.add_item(btn)
-                
-            except Exception as e:
-                logger.error(f"Error adding category button for '{category}': {e}")
+        # Fixed buttons, each shown when its predicate holds for the configuration
+        for predicate, label, style, custom_id, kind in _MENU_BUTTON_TABLE:
+            if predicate(self.config):
+                specs.append(ButtonSpec(label(self.config)[:80], style, custom_id, kind))
+        
+        return tuple(specs)
     
-    def _add_resource_buttons(self) -> None:
-        """Add resources and notable players buttons"""
-        # General resources button
-        resources_btn = Button(
-            label="📚 Resources",
-            style=discord.ButtonStyle.secondary,
-            custom_id="resources"
+    async def _category_dispatch(self, interaction: discord.Interaction) -> None:
+        """Open the starter list for the category whose button was pressed"""
+        # Category buttons carry the sanitized category name in their custom_id ("cat_<category>")
+        custom_id = interaction.data["custom_id"]
+        category = self.config.get_cached("main_menu_category_ids", self._build_category_ids).get(
+            custom_id, custom_id[4:]
         )
-        resources_btn.callback = self._show_resources
-        self.add_item(resources_btn)
         
-        # Notable players button (if any exist)
-        if self.config.notable_players:
-            players_btn = Button(
-                label="✨ Notable Players",
-                style=discord.ButtonStyle.secondary,
-                custom_id="notable_players"
-            )
-            players_btn.callback = self._show_notable_players
-            self.add_item(players_btn)
-    
-    def _add_info_buttons(self) -> None:
-        """Add info section buttons if configured"""
-        # Ender info button
-        if self.config.info_section_ender_title:
-            ender_btn = Button(
-                label=self.config.info_section_ender_title[:80],
-                style=discord.ButtonStyle.secondary,
-                custom_id="ender_info"
-            )
-            ender_btn.callback = self._show_ender_info
-            self.add_item(ender_btn)
+        response = interaction.response
         
-        # Routes button
-        if self.config.info_section_routes_title:
-            routes_btn = Button(
-                label=self.config.info_section_routes_title[:80],
-                style=discord.ButtonStyle.secondary,
-                custom_id="routes_info"
-            )
-            routes_btn.callback = self._show_routes
-            self.add_item(routes_btn)
-    
-    def _add_utility_buttons(self) -> None:
-        """Add utility buttons like close"""
-        close_btn = Button(
-            label="✖️ Close",
-            style=discord.ButtonStyle.grey,
-            custom_id="close"
-        )
-        close_btn.callback = self._close
-        self.add_item(close_btn)
-    
-    def _make_category_callback(self, category: str):
-        """Create callback for category button with validation"""
-        async def callback(interaction: discord.Interaction):
-            try:
-                # Validate category exists
-                if category not in self.config.combo_categories:
-                    await interaction.response.send_message(
-                        f"❌ Category '{category}' no longer exists.",
-                        ephemeral=True
-                    )
-                    return
-                
-                # Get starters for category
-                starters = self.config.starters.get(category, [])
-                if not starters:
-                    await interaction.response.send_message(
-                        f"⚠️ No starters configured for **{category}**.\n"
-                        f"Ask an admin to add starters using `/admin add_starter`.",
-                        ephemeral=True
-                    )
-                    return
-                
-                # Import here to avoid circular imports
-                from views.starter_list import StarterListView
-                
-                view = StarterListView(
-                    self.user,
-                    self.config,
-                    self.data_manager,
-                    category,
-                    starters
-                )
-                
-                self.stop()
-                await interaction.response.edit_message(
-                    embed=await view.create_embed(),
-                    view=view
+        try:
+            # Validate category exists
+            if category not in self.config.combo_categories_set:
+                await response.send_message(
+                    f"❌ Category '{category}' no longer exists.",
+                    ephemeral=True
                 )
-                view.message = interaction.message
-                
-            except Exception as e:
-                logger.error(f"Error in category callback for '{category}': {e}")
-                await interaction.response.send_message(
-                    f"❌ Failed to load {category} starters. Please try again.",
+                return
+            
+            # Get starters for category
+            starters = self.config.starters.get(category, [])
+            if not starters:
+                await response.send_message(
+                    f"⚠️ No starters configured for **{category}**.\n"
+                    f"Ask an admin to add starters using `/admin add_starter`.",
                     ephemeral=True
                 )
-        
-        return callback
+                return
+            
+            view = StarterListView(
+                self.user,
+                self.config,
+                self.data_manager,
+                category,
+                starters
+            )
+            
+            self.stop()
+            await response.edit_message(
+                embed=await view.create_embed(),
+                view=view
+            )
+            view.message = interaction.message
+            
+        except Exception as e:
+            logger.error("Error in category callback for '%s': %s", category, e)
+            await self._send_error(interaction, f"❌ Failed to load {category} starters. Please try again.")
+    
+    def _build_category_ids(self) -> Dict[str, str]:
+        """Map category button custom_ids back to category names"""
+        return {
+            spec.custom_id: spec.category
+            for spec in self.config.get_cached("main_menu_buttons", self._build_button_specs)
+            if spec.kind == "category"
+        }
     
     async def _show_resources(self, interaction: discord.Interaction) -> None:
         """Show resources menu"""
         try:
-            from views.resource import ResourceMenuView
-            
             view = ResourceMenuView(self.user, self.config, self.data_manager)
             
             self.stop()
@@ -207,17 +192,12 @@ class MainMenuView(BaseView):
             view.message = interaction.message
             
         except Exception as e:
-            logger.error(f"Error showing resources menu: {e}")
-            await interaction.response.send_message(
-                "❌ Failed to load resources menu. Please try again.",
-                ephemeral=True
-            )
+            logger.error("Error showing resources menu: %s", e)
+            await self._send_error(interaction, "❌ Failed to load resources menu. Please try again.")
     
     async def _show_notable_players(self, interaction: discord.Interaction) -> None:
         """Show notable players directly"""
         try:
-            from views.player import PlayerListView
-            
             view = PlayerListView(
                 self.user,
                 self.config,
@@ -227,40 +207,19 @@ class MainMenuView(BaseView):
             
             self.stop()
             await interaction.response.edit_message(
-                embed=await view.create_embed(),
+                embed=view.create_embed(),
                 view=view
             )
             view.message = interaction.message
             
         except Exception as e:
-            logger.error(f"Error showing notable players: {e}")
-            await interaction.response.send_message(
-                "❌ Failed to load notable players. Please try again.",
-                ephemeral=True
-            )
+            logger.error("Error showing notable players: %s", e)
+            await self._send_error(interaction, "❌ Failed to load notable players. Please try again.")
     
     async def _show_ender_info(self, interaction: discord.Interaction) -> None:
         """Show ender info section"""
         try:
-            embed = discord.Embed(
-                title=self.config.info_section_ender_title,
-                color=self.config.embed_color
-            )
-            embed.set_thumbnail(url=self.config.thumbnail_url)
-            
-            # Add ender info content
-            if self.config.ender_info:
-                description = "\n".join(self.config.ender_info)
-                # Ensure description fits within Discord limits
-                if len(description) > 4000:
-                    description = description[:3997] + "..."
-                embed.description = description
-            else:
-                embed.description = "_No ender information configured yet._"
-            
-            # Add credit footer if available
-            if self.config.ender_info_credit:
-                embed.set_footer(text=self.config.ender_info_credit)
+            embed = self.config.get_cached_embed("ender_info", self._build_ender_embed)
             
             # Create simple back view
             back_view = self._create_back_view()
@@ -270,31 +229,13 @@ class MainMenuView(BaseView):
             back_view.message = interaction.message
             
         except Exception as e:
-            logger.error(f"Error showing ender info: {e}")
-            await interaction.response.send_message(
-                "❌ Failed to load ender information. Please try again.",
-                ephemeral=True
-            )
+            logger.error("Error showing ender info: %s", e)
+            await self._send_error(interaction, "❌ Failed to load ender information. Please try again.")
     
     async def _show_routes(self, interaction: discord.Interaction) -> None:
         """Show interesting routes section"""
         try:
-            embed = discord.Embed(
-                title=self.config.info_section_routes_title,
-                color=self.config.embed_color
-            )
-            embed.set_thumbnail(url=self.config.thumbnail_url)
-            
-            # Add routes content
-            if self.config.interesting_routes:
-                # Format as bullet points
-                routes_text = "\n".join(f"• {route}" for route in self.config.interesting_routes)
-                # Ensure description fits within Discord limits
-                if len(routes_text) > 4000:
-                    routes_text = routes_text[:3997] + "..."
-                embed.description = routes_text
-            else:
-                embed.description = "_No interesting routes configured yet._"
+            embed = self.config.get_cached_embed("routes_info", self._build_routes_embed)
             
             # Create simple back view
             back_view = self._create_back_view()
@@ -304,11 +245,33 @@ class MainMenuView(BaseView):
             back_view.message = interaction.message
             
         except Exception as e:
-            logger.error(f"Error showing routes info: {e}")
-            await interaction.response.send_message(
-                "❌ Failed to load routes information. Please try again.",
-                ephemeral=True
-            )
+            logger.error("Error showing routes info: %s", e)
+            await self._send_error(interaction, "❌ Failed to load routes information. Please try again.")
+    
+    def _build_ender_embed(self) -> discord.Embed:
+        """Build the ender info embed from the current configuration"""
+        data = {
+            "title": self.config.info_section_ender_title,
+            "color": self.config.embed_color.value,
+            "thumbnail": {"url": self.config.thumbnail_url},
+            "description": self.config.ender_info_rendered or "_No ender information configured yet._"
+        }
+        
+        # Add credit footer if available
+        if self.config.ender_info_credit:
+            data["footer"] = {"text": self.config.ender_info_credit}
+        
+        return discord.Embed.from_dict(data)
+    
+    def _build_routes_embed(self) -> discord.Embed:
+        """Build the interesting routes embed from the current configuration"""
+        return discord.Embed.from_dict({
+            "title": self.config.info_section_routes_title,
+            "color": self.config.embed_color.value,
+            "thumbnail": {"url": self.config.thumbnail_url},
+            # Routes content as bullet points
+            "description": self.config.routes_rendered or "_No interesting routes configured yet._"
+        })
     
     def _create_back_view(self) -> 'InfoBackView':
         """Create a simple back view for info sections"""
@@ -317,64 +280,56 @@ class MainMenuView(BaseView):
     async def _close(self, interaction: discord.Interaction) -> None:
         """Close the main menu"""
         try:
-            self.stop()
             await interaction.response.edit_message(
                 content="✖️ *Menu closed. Use `/combos` to reopen.*",
-                view=None,
-                embed=None
+                embeds=[],
+                attachments=[],
+                view=None
             )
+            # Stop only once the edit went through so a failed close can be retried
+            self.stop()
             
         except Exception as e:
-            logger.error(f"Error closing main menu: {e}")
-            # Try to edit without content if the above fails
-            try:
-                await interaction.response.edit_message(view=None, embed=None)
-            except:
-                pass
+            logger.error("Error closing main menu: %s", e)
     
     def create_embed(self) -> discord.Embed:
-        """Create main menu embed"""
+        """Create main menu embed, reused until the configuration changes"""
         try:
-            embed = discord.Embed(
-                title=f"🎮 {self.config.character_name} Combos",
-                description="Select a category to explore:",
-                color=self.config.embed_color
-            )
-            embed.set_thumbnail(url=self.config.thumbnail_url)
-            
-            # Add helpful information
-            if self.config.combo_categories:
-                categories_text = ", ".join(self.config.combo_categories)
-                embed.add_field(
-                    name="📂 Available Categories",
-                    value=categories_text,
-                    inline=False
-                )
-            
-            # Add stats
-            total_starters = sum(len(starters) for starters in self.config.starters.values())
-            stats_text = f"• {len(self.config.combo_categories)} categories\n"
-            stats_text += f"• {total_starters} total starters\n"
-            stats_text += f"• {len(self.config.notable_players)} notable players"
-            
-            embed.add_field(
-                name="📊 Bot Stats",
-                value=stats_text,
-                inline=True
-            )
-            
-            embed.set_footer(text="Use the buttons below to navigate")
-            
-            return embed
+            return self.config.get_cached_embed("main_menu", self._build_embed)
             
         except Exception as e:
-            logger.error(f"Error creating main menu embed: {e}")
+            logger.error("Error creating main menu embed: %s", e)
             # Return a basic embed if there's an error
-            return discord.Embed(
-                title="🎮 Combo Bot",
-                description="Welcome! Use the buttons below to navigate.",
-                color=discord.Color.blue()
+            return discord.Embed.from_dict(_FALLBACK_EMBED_DICT)
+    
+    def _build_embed(self) -> discord.Embed:
+        """Build the main menu embed from the current configuration"""
+        embed = discord.Embed(
+            title=f"🎮 {self.config.character_name} Combos",
+            description="Select a category to explore:",
+            color=self.config.embed_color
+        )
+        embed.set_thumbnail(url=self.config.thumbnail_url)
+        
+        # Add helpful information
+        if self.config.combo_categories:
+            categories_text = ", ".join(self.config.combo_categories)
+            embed.add_field(
+                name="📂 Available Categories",
+                value=categories_text,
+                inline=False
             )
+        
+        # Add stats
+        embed.add_field(
+            name="📊 Bot Stats",
+            value=self.config.stats_text,
+            inline=True
+        )
+        
+        embed.set_footer(text="Use the buttons below to navigate")
+        
+        return embed
 
 
 class InfoBackView(BaseView):
@@ -414,8 +369,5 @@ class InfoBackView(BaseView):
             main_view.message = interaction.message
             
         except Exception as e:
-            logger.error(f"Error returning to main menu: {e}")
-            await interaction.response.send_message(
-                "❌ Failed to return to main menu. Please use `/combos` to restart.",
-                ephemeral=True
-            )
+            logger.error("Error returning to main menu: %s", e)
+            await self._send_error(interaction, "❌ Failed to return to main menu. Please use `/combos` to restart.")
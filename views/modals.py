@@ -3,15 +3,15 @@ Modal input forms for Discord UI
 Handles all user input modals with proper data manager injection
 """
 
+import re
 import logging
-from typing import TYPE_CHECKING, Optional
-from urllib.parse import urlparse
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
 
 import discord
 from discord.ui import Modal, TextInput
 
-from utils import validate_url, validate_discord_color_hex
-from data import ResourceEntry
+from utils import validate_url, validate_url_parsed, validate_discord_color_hex
+from data import ResourceEntry, PlayerEntry
 
 if TYPE_CHECKING:
     from data import DataManager
@@ -19,6 +19,22 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Literal "\\n" sequences separate player description lines
+_DESC_SPLIT = re.compile(r'\\n')
+
+# Static validation replies shared by the modals
+_ERR_CHAR_NAME_REQUIRED = "❌ Character name is required."
+_ERR_THUMBNAIL_URL = "❌ Invalid thumbnail URL. Please provide a valid HTTP/HTTPS URL."
+_ERR_COLOR_HEX = "❌ Invalid color hex value. Please use 6-digit hex format (e.g., FF0000)."
+_ERR_RESOURCE_NAME_REQUIRED = "❌ Resource name is required."
+_ERR_RESOURCE_TYPE_REQUIRED = "❌ Resource type is required."
+_ERR_RESOURCE_URL = "❌ Invalid URL. Please provide a valid HTTP/HTTPS URL."
+_ERR_PLAYER_NAME_REQUIRED = "❌ Player name is required."
+_ERR_REGION_REQUIRED = "❌ Region emoji is required."
+_ERR_SOCIAL_URL = "❌ Invalid social media URL. Please provide a valid HTTP/HTTPS URL."
+_ERR_IMAGE_URL = "❌ Invalid image URL. Please provide a valid HTTP/HTTPS URL."
+_ERR_EMPTY_VALUE = "❌ Value cannot be empty."
+
 
 class BaseModal(Modal):
     """
@@ -27,6 +43,12 @@ class BaseModal(Modal):
     This fixes the issue mentioned in the review about using global data_manager
     """
     
+    # (attribute, TextInput kwargs) for each input, in display order
+    _FIELDS: Tuple[Tuple[str, Dict[str, Any]], ...] = ()
+    
+    # Reply sent by on_error when on_submit raises
+    _ERROR_MESSAGE = "❌ An error occurred while processing your input. Please try again."
+    
     def __init__(self, data_manager: 'DataManager', title: str = "Input Form", timeout: float = 300.0):
         """
         Initialize base modal
@@ -39,17 +61,26 @@ class BaseModal(Modal):
         super().__init__(title=title, timeout=timeout)
         self.data_manager = data_manager
     
+    def _add_fields(self, defaults: Optional[Dict[str, str]] = None) -> None:
+        """
+        Create and add the inputs described by _FIELDS
+        
+        Args:
+            defaults: Pre-filled values keyed by attribute name
+        """
+        defaults = defaults or {}
+        for attr, kwargs in self._FIELDS:
+            text_input = TextInput(default=defaults.get(attr), **kwargs)
+            setattr(self, attr, text_input)
+            self.add_item(text_input)
+    
     async def on_error(self, interaction: discord.Interaction, error: Exception) -> None:
         """Handle modal errors with logging and user feedback"""
         logger.error(f"Modal error in {self.__class__.__name__}: {error}", exc_info=True)
         
-        error_message = "❌ An error occurred while processing your input. Please try again."
-        
+        send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
         try:
-            if not interaction.response.is_done():
-                await interaction.response.send_message(error_message, ephemeral=True)
-            else:
-                await interaction.followup.send(error_message, ephemeral=True)
+            await send(self._ERROR_MESSAGE, ephemeral=True)
         except Exception as follow_error:
             logger.error(f"Failed to send modal error message: {follow_error}")
 
@@ -65,125 +96,105 @@ class SetupModal(BaseModal, title="Bot Setup"):
     - Info section title configuration
     """
     
-    def __init__(self, data_manager: 'DataManager', current_config: 'BotConfiguration'):
-        """
-        Initialize setup modal
-        
-        Args:
-            data_manager: DataManager instance
-            current_config: Current bot configuration
-        """
-        super().__init__(data_manager, "Bot Setup")
-        
-        self.char_name = TextInput(
+    _ERROR_MESSAGE = "❌ An error occurred while saving the configuration. Please try again."
+    
+    _FIELDS = (
+        ('char_name', dict(
             label="Character Name",
             placeholder="e.g., Carmine, Sol Badguy, Ryu",
-            default=current_config.character_name,
             required=True,
             max_length=50
-        )
-        
-        self.thumbnail = TextInput(
+        )),
+        ('thumbnail', dict(
             label="Thumbnail URL (optional)",
             placeholder="https://i.imgur.com/example.png",
-            default=current_config.thumbnail_url,
             required=False,
             max_length=500
-        )
-        
-        self.color = TextInput(
+        )),
+        ('color', dict(
             label="Embed Color (hex, without #)",
             placeholder="FF0000 for red, 00FF00 for green",
-            default=current_config.main_embed_color_hex.replace("0x", ""),
             required=False,
             max_length=6
-        )
-        
-        self.ender_title = TextInput(
+        )),
+        ('ender_title', dict(
             label="Ender Info Section Title (blank to hide)",
             placeholder="📑 Ender Optimization",
-            default=current_config.info_section_ender_title,
             required=False,
             max_length=50
-        )
-        
-        self.routes_title = TextInput(
+        )),
+        ('routes_title', dict(
             label="Routes Section Title (blank to hide)",
             placeholder="✨ Special Routes",
-            default=current_config.info_section_routes_title,
             required=False,
             max_length=50
-        )
+        ))
+    )
+    
+    def __init__(self, data_manager: 'DataManager', current_config: 'BotConfiguration'):
+        """
+        Initialize setup modal
         
-        self.add_item(self.char_name)
-        self.add_item(self.thumbnail)
-        self.add_item(self.color)
-        self.add_item(self.ender_title)
-        self.add_item(self.routes_title)
+        Args:
+            data_manager: DataManager instance
+            current_config: Current bot configuration
+        """
+        super().__init__(data_manager, "Bot Setup")
+        
+        self._add_fields({
+            'char_name': current_config.character_name,
+            'thumbnail': current_config.thumbnail_url,
+            'color': current_config.main_embed_color_hex.replace("0x", ""),
+            'ender_title': current_config.info_section_ender_title,
+            'routes_title': current_config.info_section_routes_title
+        })
     
     async def on_submit(self, interaction: discord.Interaction) -> None:
         """Handle setup form submission with validation"""
-        try:
-            # Validate character name
-            char_name = self.char_name.value.strip()
-            if not char_name:
-                await interaction.response.send_message(
-                    "❌ Character name is required.",
-                    ephemeral=True
-                )
-                return
-            
-            # Validate thumbnail URL
-            thumbnail = self.thumbnail.value.strip()
-            if thumbnail and not validate_url(thumbnail):
-                await interaction.response.send_message(
-                    "❌ Invalid thumbnail URL. Please provide a valid HTTP/HTTPS URL.",
-                    ephemeral=True
-                )
-                return
-            
-            # Validate color hex
-            color = self.color.value.strip()
-            normalized_color = None
-            if color:
-                normalized_color = validate_discord_color_hex(color)
-                if not normalized_color:
-                    await interaction.response.send_message(
-                        "❌ Invalid color hex value. Please use 6-digit hex format (e.g., FF0000).",
-                        ephemeral=True
-                    )
-                    return
-            
-            # Update configuration
-            updates = {
-                'character_name': char_name,
-                'info_section_ender_title': self.ender_title.value.strip(),
-                'info_section_routes_title': self.routes_title.value.strip()
-            }
-            
-            if thumbnail:
-                updates['thumbnail_url'] = thumbnail
-            
-            if normalized_color:
-                updates['main_embed_color_hex'] = normalized_color
-            
-            await self.data_manager.update_config(**updates)
-            await self.data_manager.save(force=True)
-            
-            logger.info(f"Bot setup completed for character: {char_name}")
-            
-            await interaction.response.send_message(
-                f"✅ Bot configured successfully for **{char_name}**!\n"
-                f"Use `/combos` to see your new setup.",
-                ephemeral=True
-            )
-            
-        except Exception as e:
-            logger.error(f"Error in setup modal: {e}")
-            await interaction.response.send_message(
-                "❌ An error occurred while saving the configuration. Please try again.",
-                ephemeral=True
-            )
+        char_name = self.char_name.value.strip()
+        thumbnail = self.thumbnail.value.strip()
+        color = self.color.value.strip()
+        normalized_color = validate_discord_color_hex(color) if color else None
+        
+        # Run all validation before replying
+        errors = []
+        if not char_name:
+            errors.append(_ERR_CHAR_NAME_REQUIRED)
+        if thumbnail and not validate_url(thumbnail):
+            errors.append(_ERR_THUMBNAIL_URL)
+        if color and not normalized_color:
+            errors.append(_ERR_COLOR_HEX)
+        
+        if errors:
+            await interaction.response.send_message(errors[0], ephemeral=True)
+            return
+        
+        # Acknowledge now so config/storage work can't run past the interaction deadline
+        await interaction.response.defer(ephemeral=True)
+        
+        # Update configuration
+        updates = {
+            'character_name': char_name,
+            'info_section_ender_title': self.ender_title.value.strip(),
+            'info_section_routes_title': self.routes_title.value.strip()
+        }
+        
+        if thumbnail:
+            updates['thumbnail_url'] = thumbnail
+        
+        if normalized_color:
+            updates['main_embed_color_hex'] = normalized_color
+        
+        # Write before replying; a failed write raises into on_error
+        await self.data_manager.update_config(persist=True, **updates)
+        
+        logger.info(f"Bot setup completed for character: {char_name}")
+        
+        await interaction.followup.send(
+            f"✅ Bot configured successfully for **{char_name}**!\n"
+            f"Use `/combos` to see your new setup.",
+            ephemeral=True
+        )
 
 
 class ResourceModal(BaseModal, title="Add Resource"):
@@ -196,104 +207,88 @@ class ResourceModal(BaseModal, title="Add Resource"):
     - Optional credit/source attribution
     """
     
-    def __init__(self, data_manager: 'DataManager', link: str = ""):
-        """
-        Initialize resource modal
-        
-        Args:
-            data_manager: DataManager instance
-            link: Pre-filled link if available
-        """
-        super().__init__(data_manager, "Add Resource")
-        
-        self.name = TextInput(
+    _ERROR_MESSAGE = "❌ Failed to add resource. Please check your input and try again."
+    
+    _FIELDS = (
+        ('name', dict(
             label="Resource Name",
             placeholder="e.g., Frame Data Guide, Combo Video",
             required=True,
             max_length=100
-        )
-        
-        self.type = TextInput(
+        )),
+        ('type', dict(
             label="Resource Type",
             placeholder="e.g., video, document, spreadsheet, guide",
             required=True,
             max_length=50
-        )
-        
-        self.link = TextInput(
+        )),
+        ('link', dict(
             label="Resource URL",
             placeholder="https://example.com/resource",
-            default=link,
             required=True,
             max_length=500
-        )
-        
-        self.credit = TextInput(
+        )),
+        ('credit', dict(
             label="Credit/Source (optional)",
             placeholder="e.g., Created by PlayerName, From FGC Wiki",
             required=False,
             max_length=100
-        )
+        ))
+    )
+    
+    def __init__(self, data_manager: 'DataManager', link: str = ""):
+        """
+        Initialize resource modal
         
-        self.add_item(self.name)
-        self.add_item(self.type)
-        self.add_item(self.link)
-        self.add_item(self.credit)
+        Args:
+            data_manager: DataManager instance
+            link: Pre-filled link if available
+        """
+        super().__init__(data_manager, "Add Resource")
+        self._add_fields({'link': link})
     
     async def on_submit(self, interaction: discord.Interaction) -> None:
         """Handle resource submission with validation"""
-        try:
-            # Validate inputs
-            name = self.name.value.strip()
-            resource_type = self.type.value.strip()
-            link = self.link.value.strip()
-            credit = self.credit.value.strip() if self.credit.value else None
-            
-            if not name:
-                await interaction.response.send_message(
-                    "❌ Resource name is required.",
-                    ephemeral=True
-                )
-                return
-            
-            if not resource_type:
-                await interaction.response.send_message(
-                    "❌ Resource type is required.",
-                    ephemeral=True
-                )
-                return
-            
-            if not validate_url(link):
-                await interaction.response.send_message(
-                    "❌ Invalid URL. Please provide a valid HTTP/HTTPS URL.",
-                    ephemeral=True
-                )
-                return
-            
-            # Create and add resource
-            resource = ResourceEntry(
-                name=name,
-                type=resource_type,
-                link=link,
-                credit=credit
-            )
-            
-            await self.data_manager.add_resource(resource)
-            await self.data_manager.save()
-            
-            logger.info(f"Resource added: {name} ({resource_type})")
-            
-            await interaction.response.send_message(
-                f"✅ Resource **{name}** ({resource_type}) added successfully!",
-                ephemeral=True
-            )
-            
-        except Exception as e:
-            logger.error(f"Error adding resource: {e}")
-            await interaction.response.send_message(
-                "❌ Failed to add resource. Please check your input and try again.",
-                ephemeral=True
-            )
+        name = self.name.value.strip()
+        resource_type = self.type.value.strip()
+        link = self.link.value.strip()
+        credit_value = self.credit.value
+        credit = credit_value.strip() if credit_value else None
+        
+        # Run all validation before replying
+        errors = []
+        if not name:
+            errors.append(_ERR_RESOURCE_NAME_REQUIRED)
+        if not resource_type:
+            errors.append(_ERR_RESOURCE_TYPE_REQUIRED)
+        if not validate_url(link):
+            errors.append(_ERR_RESOURCE_URL)
+        
+        if errors:
+            await interaction.response.send_message(errors[0], ephemeral=True)
+            return
+        
+        # Acknowledge now so config/storage work can't run past the interaction deadline
+        await interaction.response.defer(ephemeral=True)
+        
+        # Create and add resource
+        resource = ResourceEntry(
+            name=name,
+            type=resource_type,
+            link=link,
+            credit=credit
+        )
+        
+        await self.data_manager.add_resource(resource)
+        # Write before replying; a failed write raises into on_error
+        await self.data_manager.save(force=True)
+        
+        logger.info(f"Resource added: {name} ({resource_type})")
+        
+        await interaction.followup.send(
+            f"✅ Resource **{name}** ({resource_type}) added successfully!",
+            ephemeral=True
+        )
 
 
 class PlayerModal(BaseModal, title="Add Notable Player"):
@@ -307,139 +302,108 @@ class PlayerModal(BaseModal, title="Add Notable Player"):
     - Multi-line description support
     """
     
-    def __init__(self, data_manager: 'DataManager'):
-        """
-        Initialize player modal
-        
-        Args:
-            data_manager: DataManager instance
-        """
-        super().__init__(data_manager, "Add Notable Player", timeout=600.0)  # Longer timeout for complex form
-        
-        self.name = TextInput(
+    _ERROR_MESSAGE = "❌ Failed to add player. Please check your input and try again."
+    
+    _FIELDS = (
+        ('name', dict(
             label="Player Name",
             placeholder="e.g., Daigo, SonicFox, Tokido",
             required=True,
             max_length=50
-        )
-        
-        self.region = TextInput(
+        )),
+        ('region', dict(
             label="Region Emoji",
             placeholder="🇺🇸 🇯🇵 🇰🇷 etc.",
             required=True,
             max_length=10
-        )
-        
-        self.social = TextInput(
+        )),
+        ('social', dict(
             label="Social Media Link",
             placeholder="https://twitter.com/player or https://youtube.com/@player",
             required=True,
             max_length=200
-        )
-        
-        self.image = TextInput(
+        )),
+        ('image', dict(
             label="Character Image URL",
             placeholder="https://i.imgur.com/character.png",
             required=True,
             max_length=500
-        )
-        
-        self.desc = TextInput(
+        )),
+        ('desc', dict(
             label="Description (use \\n for line breaks)",
             placeholder="Famous for X combo\\nWon Y tournament\\nKnown for Z playstyle",
             style=discord.TextStyle.paragraph,
             required=False,
             max_length=800
-        )
+        ))
+    )
+    
+    def __init__(self, data_manager: 'DataManager'):
+        """
+        Initialize player modal
         
-        self.add_item(self.name)
-        self.add_item(self.region)
-        self.add_item(self.social)
-        self.add_item(self.image)
-        self.add_item(self.desc)
+        Args:
+            data_manager: DataManager instance
+        """
+        super().__init__(data_manager, "Add Notable Player", timeout=600.0)  # Longer timeout for complex form
+        self._add_fields()
     
     async def on_submit(self, interaction: discord.Interaction) -> None:
         """Handle player submission with validation"""
-        try:
-            # Validate inputs
-            name = self.name.value.strip()
-            region_emoji = self.region.value.strip()
-            social_link = self.social.value.strip()
-            image_url = self.image.value.strip()
-            description = self.desc.value.strip() if self.desc.value else ""
-            
-            if not name:
-                await interaction.response.send_message(
-                    "❌ Player name is required.",
-                    ephemeral=True
-                )
-                return
-            
-            if not region_emoji:
-                await interaction.response.send_message(
-                    "❌ Region emoji is required.",
-                    ephemeral=True
-                )
-                return
-            
-            # Validate URLs
-            if not validate_url(social_link):
-                await interaction.response.send_message(
-                    "❌ Invalid social media URL. Please provide a valid HTTP/HTTPS URL.",
-                    ephemeral=True
-                )
-                return
-            
-            if not validate_url(image_url):
-                await interaction.response.send_message(
-                    "❌ Invalid image URL. Please provide a valid HTTP/HTTPS URL.",
-                    ephemeral=True
-                )
-                return
-            
-            # Check for duplicate players
-            existing_players = self.data_manager.config.notable_players
-            if any(p.get("name", "").lower() == name.lower() for p in existing_players):
-                await interaction.response.send_message(
-                    f"❌ Player **{name}** already exists in the database.",
-                    ephemeral=True
-                )
-                return
-            
-            # Process description
-            description_lines = []
-            if description:
-                # Split by \\n for line breaks
-                lines = description.split('\\n')
-                description_lines = [line.strip() for line in lines if line.strip()]
-            
-            # Create player data
-            player_data = {
-                "name": name,
-                "region_emoji": region_emoji,
-                "social_link": social_link,
-                "image_url": image_url,
-                "description_lines": description_lines,
-                "color_footer": f"{name}'s playstyle"
-            }
-            
-            # Add player to configuration
-            self.data_manager.config.notable_players.append(player_data)
-            await self.data_manager.save(force=True)
-            
-            logger.info(f"Notable player added: {name} ({region_emoji})")
-            
-            await interaction.response.send_message(
-                f"✅ Notable player **{name}** {region_emoji} added successfully!",
-                ephemeral=True
-            )
-            
-        except Exception as e:
-            logger.error(f"Error adding player: {e}")
-            await interaction.response.send_message(
-                "❌ Failed to add player. Please check your input and try again.",
-                ephemeral=True
-            )
+        name = self.name.value.strip()
+        region_emoji = self.region.value.strip()
+        social_link = self.social.value.strip()
+        image_url = self.image.value.strip()
+        description_value = self.desc.value
+        description = description_value.strip() if description_value else ""
+        
+        # Run all validation before replying
+        errors = []
+        if not name:
+            errors.append(_ERR_PLAYER_NAME_REQUIRED)
+        if not region_emoji:
+            errors.append(_ERR_REGION_REQUIRED)
+        social = validate_url_parsed(social_link)
+        if not social:
+            errors.append(_ERR_SOCIAL_URL)
+        if not validate_url_parsed(image_url):
+            errors.append(_ERR_IMAGE_URL)
+        if name and self.data_manager.has_player(name):
+            errors.append(f"❌ Player **{name}** already exists in the database.")
+        
+        if errors:
+            await interaction.response.send_message(errors[0], ephemeral=True)
+            return
+        
+        # Acknowledge now so config/storage work can't run past the interaction deadline
+        await interaction.response.defer(ephemeral=True)
+        
+        # Process description, splitting by \\n for line breaks and dropping blank lines
+        description_lines = [
+            line for line in (part.strip() for part in _DESC_SPLIT.split(description)) if line
+        ] if description else []
+        
+        # Create player data
+        player = PlayerEntry(
+            name=name,
+            social_link=social_link,
+            region_emoji=region_emoji,
+            image_url=image_url,
+            description_lines=description_lines,
+            color_footer=f"{name}'s playstyle"
+        )
+        
+        # Add player to configuration
+        await self.data_manager.add_player(player)
+        # Write before replying; a failed write raises into on_error
+        await self.data_manager.save(force=True)
+        
+        logger.info(f"Notable player added: {name} ({region_emoji}) via {social.hostname}")
+        
+        await interaction.followup.send(
+            f"✅ Notable player **{name}** {region_emoji} added successfully!",
+            ephemeral=True
+        )
 
 
 class EditConfigModal(BaseModal, title="Edit Configuration"):
@@ -447,6 +411,8 @@ class EditConfigModal(BaseModal, title="Edit Configuration"):
     Modal for editing specific configuration values
     """
     
+    _ERROR_MESSAGE = "❌ Failed to update configuration. Please try again."
+    
     def __init__(self, data_manager: 'DataManager', field_name: str, current_value: str, description: str = ""):
         """
         Initialize config edit modal
@@ -457,11 +423,12 @@ class EditConfigModal(BaseModal, title="Edit Configuration"):
             current_value: Current value of the field
             description: Description of what this field does
         """
-        super().__init__(data_manager, f"Edit {field_name.replace('_', ' ').title()}")
+        self.display_name = field_name.replace('_', ' ').title()
+        super().__init__(data_manager, f"Edit {self.display_name}")
         self.field_name = field_name
         
         self.value_input = TextInput(
-            label=field_name.replace('_', ' ').title(),
+            label=self.display_name,
             placeholder=description or f"Enter new {field_name}",
             default=str(current_value),
             required=True,
@@ -472,30 +439,21 @@ class EditConfigModal(BaseModal, title="Edit Configuration"):
     
     async def on_submit(self, interaction: discord.Interaction) -> None:
         """Handle configuration edit submission"""
-        try:
-            new_value = self.value_input.value.strip()
-            
-            if not new_value:
-                await interaction.response.send_message(
-                    "❌ Value cannot be empty.",
-                    ephemeral=True
-                )
-                return
-            
-            # Update configuration
-            await self.data_manager.update_config(**{self.field_name: new_value})
-            await self.data_manager.save(force=True)
-            
-            logger.info(f"Configuration updated: {self.field_name} = {new_value}")
-            
-            await interaction.response.send_message(
-                f"✅ Updated **{self.field_name.replace('_', ' ').title()}** successfully!",
-                ephemeral=True
-            )
-            
-        except Exception as e:
-            logger.error(f"Error updating configuration: {e}")
-            await interaction.response.send_message(
-                "❌ Failed to update configuration. Please try again.",
-                ephemeral=True
-            )
+        new_value = self.value_input.value.strip()
+        
+        if not new_value:
+            await interaction.response.send_message(_ERR_EMPTY_VALUE, ephemeral=True)
+            return
+        
+        await interaction.response.defer(ephemeral=True)
+        
+        # Update configuration
+        # Write before replying; a failed write raises into on_error
+        await self.data_manager.update_config(persist=True, **{self.field_name: new_value})
+        
+        logger.info(f"Configuration updated: {self.field_name} = {new_value}")
+        
+        await interaction.followup.send(
+            f"✅ Updated **{self.display_name}** successfully!",
+            ephemeral=True
+        )
@@ -4,19 +4,33 @@ This addresses the PlayerListView instantiation bug mentioned in the review
 """
 
 import logging
-from typing import Dict, List, Any, TYPE_CHECKING
+from collections import OrderedDict
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 import discord
 from discord.ui import Button
 
 from views.base import PaginatedView, BaseView
+from views.modals import PlayerModal
+from views.resource import ResourceMenuView
 
 if TYPE_CHECKING:
     from data import DataManager
-    from config import BotConfiguration
+    from config import BotConfiguration, PlayerEntry
 
 logger = logging.getLogger(__name__)
 
+# Player detail embeds kept per view for paging back and forth
+_DETAIL_EMBED_CACHE_SIZE = 16
+
+# Player management buttons: (predicate, label, style, custom_id, handler)
+_MANAGEMENT_BUTTONS = (
+    (lambda c: True, "➕ Add Player", discord.ButtonStyle.success, "add_player", "_add_player"),
+    (lambda c: bool(c.notable_players), "👥 View Players", discord.ButtonStyle.primary,
+     "view_players", "_view_players"),
+    (lambda c: True, "↩️ Back", discord.ButtonStyle.danger, "back", "_go_back"),
+)
+
 
 class PlayerListView(PaginatedView):
     """
@@ -26,7 +40,7 @@ class PlayerListView(PaginatedView):
     """
     
     def __init__(self, user: discord.User, config: 'BotConfiguration',
-                 data_manager: 'DataManager', players: List[Dict[str, Any]]):
+                 data_manager: 'DataManager', players: List['PlayerEntry']):
         """
         Initialize player list view
         
@@ -34,85 +48,97 @@ class PlayerListView(PaginatedView):
             user: Discord user who can interact with this view
             config: Bot configuration
             data_manager: DataManager instance
-            players: List of player dictionaries
+            players: List of player entries
         """
         super().__init__(user, players, config.page_sizes.players, config.view_timeout_seconds)
         self.config = config
         self.data_manager = data_manager
+        self._list_lines: List[str] = []
+        self._button_names: List[str] = []
+        self._labels_key: Optional[Tuple[int, int]] = None
         self.update_buttons()
     
+    def _refresh_labels(self) -> None:
+        """Format list lines and button names once per player list"""
+        # Player edits mutate the shared list in place and bump the config version
+        key = (id(self.items), self.config.version)
+        if key == self._labels_key:
+            return
+        
+        # Number prefixes are added per page; the bold span closes after the name
+        self._list_lines = [f"{p.name}** {p.region_emoji}" for p in self.items]
+        
+        # Leave room for a "9999. " prefix within Discord's 80 character label limit
+        max_name_len = 80 - len("9999. ")
+        self._button_names = []
+        for p in self.items:
+            button_name = f"{p.name} {p.region_emoji}"
+            if len(button_name) > max_name_len:
+                button_name = f"{p.name[:50]}... {p.region_emoji}"
+            self._button_names.append(button_name)
+        
+        self._labels_key = key
+    
+    def _player_lines(self) -> List[str]:
+        """Get each player's list line without its number"""
+        self._refresh_labels()
+        return self._list_lines
+    
     def _add_page_items(self) -> None:
         """Add player selection buttons for current page"""
-        try:
-            for i, player in enumerate(self.current_items):
-                global_index = self.current_page * self.per_page + i
-                name = player.get('name', 'Unknown Player')
-                emoji = player.get('region_emoji', '')
-                
-                # Create button label with length validation
-                button_label = f"{global_index + 1}. {name} {emoji}"
-                if len(button_label) > 80:  # Discord button label limit
-                    button_label = f"{global_index + 1}. {name[:50]}... {emoji}"
-                
-                btn = Button(
-                    label=button_label,
-                    style=discord.ButtonStyle.primary,
-                    custom_id=f"player_{global_index}"
-                )
-                btn.callback = self._make_player_callback(global_index)
-                self.add_item(btn)
-                
-        except Exception as e:
-            logger.error(f"Error adding player buttons: {e}")
+        self._refresh_labels()
+        start, end, _ = self.page_bounds()
+        for global_index in range(start, end):
+            btn = Button(
+                label=f"{global_index + 1}. {self._button_names[global_index]}",
+                style=discord.ButtonStyle.primary,
+                custom_id=f"player_{global_index}"
+            )
+            btn.callback = self._on_player_click
+            self.add_item(btn)
     
-    def _make_player_callback(self, index: int):
-        """Create callback for player selection button"""
-        async def callback(interaction: discord.Interaction):
-            try:
-                # Validate index
-                if index >= len(self.items):
-                    await interaction.response.send_message(
-                        "❌ Invalid player selection.",
-                        ephemeral=True
-                    )
-                    return
-                
-                # Create player detail view
-                view = PlayerDetailView(
-                    self.user,
-                    self.config,
-                    self.data_manager,  # Pass data_manager to fix the bug
-                    self.items,
-                    index
-                )
-                
-                self.stop()
-                await interaction.response.edit_message(
-                    embed=view.create_embed(),
-                    view=view
-                )
-                view.message = interaction.message
-                
-            except Exception as e:
-                logger.error(f"Error in player callback: {e}")
+    async def _on_player_click(self, interaction: discord.Interaction) -> None:
+        """Show details for the player whose button was clicked"""
+        try:
+            # Player buttons carry their list index in their custom_id ("player_<index>")
+            index = int(interaction.data["custom_id"][7:])
+            
+            # Validate index
+            if index >= len(self.items):
                 await interaction.response.send_message(
-                    "❌ Failed to display player details. Please try again.",
+                    "❌ Invalid player selection.",
                     ephemeral=True
                 )
-        
-        return callback
+                return
+            
+            # Create player detail view
+            view = PlayerDetailView(
+                self.user,
+                self.config,
+                self.data_manager,  # Pass data_manager to fix the bug
+                index
+            )
+            embed = view.create_embed()
+            
+            self.stop()
+            await interaction.response.edit_message(embed=embed, view=view)
+            view.message = interaction.message
+            
+        except Exception as e:
+            logger.error(f"Error in player callback: {e}")
+            await interaction.response.send_message(
+                "❌ Failed to display player details. Please try again.",
+                ephemeral=True
+            )
     
     async def _go_back(self, interaction: discord.Interaction) -> None:
         """Return to resource menu"""
         try:
-            from views.resource import ResourceMenuView
+            view = ResourceMenuView(self.user, self.config, self.data_manager)
+            embed = view.create_embed()
             
             self.stop()
-            view = ResourceMenuView(self.user, self.config, self.data_manager)
-            await interaction.response.edit_message(
-                embed=view.create_embed(),
-                view=view
-            )
+            await interaction.response.edit_message(embed=embed, view=view)
             view.message = interaction.message
             
         except Exception as e:
@@ -122,38 +148,28 @@ class PlayerListView(PaginatedView):
                 ephemeral=True
             )
     
-    async def create_embed(self) -> discord.Embed:
+    def create_embed(self) -> discord.Embed:
         """Create player list embed"""
-        try:
-            embed = discord.Embed(
-                title=f"✨ Notable Players (Page {self.current_page + 1}/{self.max_pages})",
-                color=self.config.embed_color
-            )
-            embed.set_thumbnail(url=self.config.thumbnail_url)
-            
-            if not self.items:
-                embed.description = "_No notable players configured yet._"
-            else:
-                descriptions = []
-                for i, player in enumerate(self.current_items):
-                    global_index = self.current_page * self.per_page + i
-                    name = player.get('name', 'Unknown Player')
-                    emoji = player.get('region_emoji', '')
-                    descriptions.append(f"**{global_index + 1}. {name}** {emoji}")
-                
-                embed.description = "\n".join(descriptions) + "\n\n**Select a player for details.**"
-            
-            embed.set_footer(text=self.get_page_info())
-            return embed
+        embed = discord.Embed(
+            title=f"✨ Notable Players (Page {self.current_page + 1}/{self.max_pages})",
+            color=self.config.embed_color
+        )
+        embed.set_thumbnail(url=self.config.thumbnail_url)
+        
+        if not self.items:
+            embed.description = "_No notable players configured yet._"
+        else:
+            start, end, _ = self.page_bounds()
+            descriptions = [
+                f"**{number}. {line}"
+                for number, line in enumerate(self._player_lines()[start:end], start + 1)
+            ]
+            descriptions += ("", "**Select a player for details.**")
             
-        except Exception as e:
-            logger.error(f"Error creating player list embed: {e}")
-            # Return a basic error embed
-            return discord.Embed(
-                title="❌ Error",
-                description="Failed to load player list.",
-                color=discord.Color.red()
-            )
+            embed.description = "\n".join(descriptions)
+        
+        embed.set_footer(text=self.get_page_info())
+        return embed
 
 
 class PlayerDetailView(BaseView):
@@ -164,7 +180,7 @@ class PlayerDetailView(BaseView):
     """
     
     def __init__(self, user: discord.User, config: 'BotConfiguration',
-                 data_manager: 'DataManager', all_players: List[Dict[str, Any]], current_index: int):
+                 data_manager: 'DataManager', current_index: int):
         """
         Initialize player detail view
         
@@ -172,59 +188,61 @@ class PlayerDetailView(BaseView):
             user: Discord user who can interact with this view
             config: Bot configuration
             data_manager: DataManager instance (FIXED: now properly stored)
-            all_players: List of all player dictionaries
-            current_index: Index of currently displayed player
+            current_index: Index of the displayed player in config.notable_players
         """
         super().__init__(user, config.view_timeout_seconds)
         self.config = config
         self.data_manager = data_manager  # FIXED: Store data_manager
-        self.all_players = all_players
-        self.current_index = max(0, min(current_index, len(all_players) - 1))
+        # Players are read from the config by index; navigation covers those present at open
+        self._player_count = len(config.notable_players)
+        self._last_index = self._player_count - 1
+        self.current_index = max(0, min(current_index, self._last_index))
+        self._embed_cache: "OrderedDict[Tuple[int, int], discord.Embed]" = OrderedDict()
+        self._add_buttons()
         self._update_buttons()
     
+    def _add_buttons(self) -> None:
+        """Create the navigation buttons once; _update_buttons only toggles them"""
+        # Previous player button
+        self._prev_btn = Button(
+            label="◀️ Previous Player",
+            style=discord.ButtonStyle.primary,
+            custom_id="prev_player"
+        )
+        self._prev_btn.callback = self._prev_player
+        self.add_item(self._prev_btn)
+        
+        # Next player button
+        self._next_btn = Button(
+            label="Next Player ▶️",
+            style=discord.ButtonStyle.primary,
+            custom_id="next_player"
+        )
+        self._next_btn.callback = self._next_player
+        self.add_item(self._next_btn)
+        
+        # Back to list button
+        back_btn = Button(
+            label="↩️ Player List",
+            style=discord.ButtonStyle.danger,
+            custom_id="back_to_list"
+        )
+        back_btn.callback = self._back_to_list
+        self.add_item(back_btn)
+    
     def _update_buttons(self) -> None:
         """Update navigation buttons based on current position"""
-        try:
-            self.clear_items()
-            
-            # Previous player button
-            if self.current_index > 0:
-                prev_btn = Button(
-                    label="◀️ Previous Player",
-                    style=discord.ButtonStyle.primary,
-                    custom_id="prev_player"
-                )
-                prev_btn.callback = self._prev_player
-                self.add_item(prev_btn)
-            
-            # Next player button
-            if self.current_index < len(self.all_players) - 1:
-                next_btn = Button(
-                    label="Next Player ▶️",
-                    style=discord.ButtonStyle.primary,
-                    custom_id="next_player"
-                )
-                next_btn.callback = self._next_player
-                self.add_item(next_btn)
-            
-            # Back to list button
-            back_btn = Button(
-                label="↩️ Player List",
-                style=discord.ButtonStyle.danger,
-                custom_id="back_to_list"
-            )
-            back_btn.callback = self._back_to_list
-            self.add_item(back_btn)
-            
-        except Exception as e:
-            logger.error(f"Error updating player detail buttons: {e}")
+        self._prev_btn.disabled = self.current_index <= 0
+        self._next_btn.disabled = self.current_index >= self._last_index
     
     async def _prev_player(self, interaction: discord.Interaction) -> None:
         """Show previous player"""
         try:
             if self.current_index > 0:
                 self.current_index -= 1
-                self._update_buttons()
+                # Moving back can only change which end we're at
+                self._prev_btn.disabled = self.current_index == 0
+                self._next_btn.disabled = False
                 await interaction.response.edit_message(
                     embed=self.create_embed(),
                     view=self
@@ -242,9 +260,10 @@ class PlayerDetailView(BaseView):
     async def _next_player(self, interaction: discord.Interaction) -> None:
         """Show next player"""
         try:
-            if self.current_index < len(self.all_players) - 1:
+            if self.current_index < self._last_index:
                 self.current_index += 1
-                self._update_buttons()
+                self._prev_btn.disabled = False
+                self._next_btn.disabled = self.current_index >= self._last_index
                 await interaction.response.edit_message(
                     embed=self.create_embed(),
                     view=self
@@ -266,24 +285,21 @@ class PlayerDetailView(BaseView):
         FIXED: Now properly passes data_manager parameter as mentioned in review
         """
         try:
-            self.stop()
-            
             # FIXED: Pass data_manager parameter that was missing in original code
             view = PlayerListView(
                 self.user, 
                 self.config, 
                 self.data_manager,  # FIXED: This was missing in the original code
-                self.all_players
+                self.config.notable_players
             )
             
             # Set the page to show the current player
             view.current_page = self.current_index // view.per_page
             view.update_buttons()
+            embed = view.create_embed()
             
-            await interaction.response.edit_message(
-                embed=await view.create_embed(),
-                view=view
-            )
+            self.stop()
+            await interaction.response.edit_message(embed=embed, view=view)
             view.message = interaction.message
             
         except Exception as e:
@@ -294,82 +310,59 @@ class PlayerDetailView(BaseView):
             )
     
     def create_embed(self) -> discord.Embed:
-        """Create player detail embed"""
-        try:
-            if not self.all_players or self.current_index >= len(self.all_players):
-                return discord.Embed(
-                    title="❌ Error",
-                    description="Player not found.",
-                    color=discord.Color.red()
-                )
-            
-            player = self.all_players[self.current_index]
-            
-            # Create title with name and region
-            name = player.get('name', 'Unknown Player')
-            region_emoji = player.get('region_emoji', '')
-            title = f"{name} {region_emoji}".strip()
-            
-            # Create description from description lines
-            description_lines = player.get('description_lines', [])
-            if description_lines:
-                description = "\n".join(description_lines)
-            else:
-                description = "_No description available._"
-            
-            # Create embed
-            embed = discord.Embed(
-                title=title,
-                description=description,
-                color=self.config.embed_color,
-                url=player.get('social_link')
-            )
-            
-            # Add character image if available
-            image_url = player.get('image_url')
-            if image_url:
-                embed.set_image(url=image_url)
-            
-            # Add footer with player position and custom footer
-            color_footer = player.get('color_footer', '')
-            position_info = f"Player {self.current_index + 1} of {len(self.all_players)}"
-            
-            if color_footer:
-                footer_text = f"{color_footer} • {position_info}"
-            else:
-                footer_text = position_info
-            
-            embed.set_footer(text=footer_text)
-            
-            # Add social link field if available
-            social_link = player.get('social_link')
-            if social_link:
-                # Extract platform name from URL for display
-                platform = "Social Media"
-                if "twitter.com" in social_link or "x.com" in social_link:
-                    platform = "Twitter/X"
-                elif "youtube.com" in social_link:
-                    platform = "YouTube"
-                elif "twitch.tv" in social_link:
-                    platform = "Twitch"
-                elif "instagram.com" in social_link:
-                    platform = "Instagram"
-                
-                embed.add_field(
-                    name=f"🔗 {platform}",
-                    value=f"[Visit Profile]({social_link})",
-                    inline=False
-                )
-            
+        """Create player detail embed, reusing it when the player was shown recently"""
+        key = (self.current_index, self.config.version)
+        embed = self._embed_cache.get(key)
+        if embed is not None:
+            self._embed_cache.move_to_end(key)
             return embed
-            
-        except Exception as e:
-            logger.error(f"Error creating player detail embed: {e}")
+        
+        embed = self._build_embed()
+        self._embed_cache[key] = embed
+        if len(self._embed_cache) > _DETAIL_EMBED_CACHE_SIZE:
+            self._embed_cache.popitem(last=False)
+        return embed
+    
+    def _build_embed(self) -> discord.Embed:
+        """Build the detail embed for the current player"""
+        players = self.config.notable_players
+        if self.current_index >= len(players):
             return discord.Embed(
                 title="❌ Error",
-                description="Failed to load player details.",
+                description="Player not found.",
                 color=discord.Color.red()
             )
+        
+        player = players[self.current_index]
+        
+        # Create embed; title and description text are formatted once per player
+        embed = discord.Embed(
+            title=player.title,
+            description=player.description_text,
+            color=self.config.embed_color,
+            url=player.social_link
+        )
+        
+        # Add character image if available
+        image_url = player.image_url
+        if image_url:
+            embed.set_image(url=image_url)
+        
+        # Add footer with player position and custom footer
+        embed.set_footer(
+            text=f"{player.footer_prefix}Player {self.current_index + 1} of {self._player_count}"
+        )
+        
+        # Add social link field if available
+        social_link = player.social_link
+        if social_link:
+            embed.add_field(
+                name=f"🔗 {player.social_platform}",
+                value=f"[Visit Profile]({social_link})",
+                inline=False
+            )
+        
+        return embed
 
 
 class PlayerManagementView(BaseView):
@@ -393,39 +386,15 @@ class PlayerManagementView(BaseView):
     
     def _add_buttons(self) -> None:
         """Add management buttons"""
-        # Add player button
-        add_btn = Button(
-            label="➕ Add Player",
-            style=discord.ButtonStyle.success,
-            custom_id="add_player"
-        )
-        add_btn.callback = self._add_player
-        self.add_item(add_btn)
-        
-        # View players button
-        if self.config.notable_players:
-            view_btn = Button(
-                label="👥 View Players",
-                style=discord.ButtonStyle.primary,
-                custom_id="view_players"
-            )
-            view_btn.callback = self._view_players
-            self.add_item(view_btn)
-        
-        # Back button
-        back_btn = Button(
-            label="↩️ Back",
-            style=discord.ButtonStyle.danger,
-            custom_id="back"
-        )
-        back_btn.callback = self._go_back
-        self.add_item(back_btn)
+        for predicate, label, style, custom_id, handler in _MANAGEMENT_BUTTONS:
+            if predicate(self.config):
+                btn = Button(label=label, style=style, custom_id=custom_id)
+                btn.callback = getattr(self, handler)
+                self.add_item(btn)
     
     async def _add_player(self, interaction: discord.Interaction) -> None:
         """Show add player modal"""
         try:
-            from views.modals import PlayerModal
-            
             modal = PlayerModal(self.data_manager)
             await interaction.response.send_modal(modal)
             
@@ -445,12 +414,10 @@ class PlayerManagementView(BaseView):
                 self.data_manager,
                 self.config.notable_players
             )
+            embed = view.create_embed()
             
             self.stop()
-            await interaction.response.edit_message(
-                embed=await view.create_embed(),
-                view=view
-            )
+            await interaction.response.edit_message(embed=embed, view=view)
             view.message = interaction.message
             
         except Exception as e:
@@ -479,7 +446,10 @@ class PlayerManagementView(BaseView):
         
         embed.add_field(
             name="Current Players",
-            value=f"{len(self.config.notable_players)} players configured",
+            value=self.config.get_cached(
+                "player_count_text",
+                lambda: f"{len(self.config.notable_players)} players configured"
+            ),
             inline=False
         )
         
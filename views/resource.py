@@ -2,20 +2,120 @@
 Resource menu and list views for managing general resources
 """
 
+import asyncio
 import logging
-from typing import List, TYPE_CHECKING
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Type, TYPE_CHECKING
 
 import discord
 from discord.ui import Button
 
 from views.base import BaseView, PaginatedView
+from views.modals import ResourceModal
 
 if TYPE_CHECKING:
     from data import DataManager, ResourceEntry
     from config import BotConfiguration
+    from views.main_menu import MainMenuView
+    from views.player import PlayerListView
 
 logger = logging.getLogger(__name__)
 
+# Views that import this module at top level, resolved on first use
+_MainMenuView = None
+_PlayerListView = None
+
+
+def _main_menu_view() -> Type['MainMenuView']:
+    """Get MainMenuView, importing it on first use since views.main_menu imports this module"""
+    global _MainMenuView
+    if _MainMenuView is None:
+        from views.main_menu import MainMenuView as _MainMenuView
+    return _MainMenuView
+
+
+def _player_list_view() -> Type['PlayerListView']:
+    """Get PlayerListView, importing it on first use since views.player imports this module"""
+    global _PlayerListView
+    if _PlayerListView is None:
+        from views.player import PlayerListView as _PlayerListView
+    return _PlayerListView
+
+# Bounds concurrent resource detail followups; interactions are already deferred,
+# so waiting here delays the reply without risking the interaction deadline
+_detail_replies = None
+
+
+def _detail_reply_slots() -> asyncio.Semaphore:
+    """Get the detail reply semaphore, creating it on first use inside the running loop"""
+    global _detail_replies
+    if _detail_replies is None:
+        _detail_replies = asyncio.Semaphore(4)
+    return _detail_replies
+
+# Resource menu buttons as (predicate, label, style, custom_id, handler name)
+_MENU_BUTTONS = (
+    (lambda c: True, "🔗 General Resources", discord.ButtonStyle.primary,
+     "general_resources", "_show_general_resources"),
+    (lambda c: bool(c.notable_players), "✨ Notable Players", discord.ButtonStyle.primary,
+     "notable_players", "_show_notable_players"),
+    (lambda c: True, "↩️ Main Menu", discord.ButtonStyle.danger, "back_main", "_go_back"),
+)
+
+# Shortest name budget worth keeping the type indicator in a button label
+_MIN_LABEL_NAME = 20
+
+# Helpful descriptions shown with resource details, keyed by lowercased type
+_TYPE_DESCRIPTIONS = {
+    'video': '🎥 Video content',
+    'document': '📄 Text document',
+    'spreadsheet': '📊 Data spreadsheet',
+    'guide': '📖 Tutorial or guide',
+    'tool': '🔧 Utility or tool',
+    'website': '🌐 Website or web app'
+}
+
+
+@lru_cache(maxsize=8)
+def _render_resource_pages(resources: Tuple[Tuple[str, str], ...],
+                           per_page: int) -> Tuple[str, Tuple[Tuple[Dict[str, Any], ...], ...]]:
+    """
+    Render the type summary and per-page button labels and lines for a resource list
+    
+    Keyed by resource contents, so concurrent viewers of the same resources share one render
+    
+    Args:
+        resources: (name, type) pairs in display order
+        per_page: Resources per page
+        
+    Returns:
+        Tuple of (type summary, render entries for each page)
+    """
+    type_counts = Counter(rtype.lower() for _, rtype in resources)
+    type_summary = ", ".join(f"{count} {rtype}" for rtype, count in type_counts.items())
+    
+    entries = []
+    for global_index, (name, rtype) in enumerate(resources):
+        # Create button label with resource name and type, shortening only the name
+        prefix = f"{global_index + 1}. "
+        type_indicator = f" ({rtype})" if rtype else ""
+        budget = 80 - len(prefix) - len(type_indicator)
+        if budget < _MIN_LABEL_NAME:  # Unusually long type; the name matters more
+            type_indicator = ""
+            budget = 80 - len(prefix)
+        
+        short_name = name if len(name) <= budget else name[:budget - 3] + "..."
+        
+        entries.append({
+            'index': global_index,
+            'button_label': f"{prefix}{short_name}{type_indicator}",
+            'line': f"**{prefix}{name}** ({rtype})"
+        })
+    
+    pages = tuple(tuple(entries[i:i + per_page]) for i in range(0, len(entries), per_page))
+    return type_summary, pages
+
 
 class ResourceMenuView(BaseView):
     """
@@ -39,47 +139,37 @@ class ResourceMenuView(BaseView):
         super().__init__(user, config.view_timeout_seconds)
         self.config = config
         self.data_manager = data_manager
+        # Most visits continue to the general resources list, so start loading it now
+        self._resources_task = asyncio.create_task(data_manager.get_resources())
         self._add_buttons()
     
+    def stop(self) -> None:
+        """Stop the view and drop an unused resource prefetch"""
+        self._resources_task.cancel()
+        super().stop()
+    
+    async def on_timeout(self) -> None:
+        """Drop an unused resource prefetch before the usual timeout handling"""
+        self._resources_task.cancel()
+        await super().on_timeout()
+    
     def _add_buttons(self) -> None:
         """Add resource category buttons"""
-        try:
-            # General resources button
-            general_btn = Button(
-                label="🔗 General Resources",
-                style=discord.ButtonStyle.primary,
-                custom_id="general_resources"
-            )
-            general_btn.callback = self._show_general_resources
-            self.add_item(general_btn)
-            
-            # Notable players button (if any exist)
-            if self.config.notable_players:
-                players_btn = Button(
-                    label="✨ Notable Players",
-                    style=discord.ButtonStyle.primary,
-                    custom_id="notable_players"
-                )
-                players_btn.callback = self._show_notable_players
-                self.add_item(players_btn)
-            
-            # Back to main menu button
-            back_btn = Button(
-                label="↩️ Main Menu",
-                style=discord.ButtonStyle.danger,
-                custom_id="back_main"
-            )
-            back_btn.callback = self._go_back
-            self.add_item(back_btn)
-            
-        except Exception as e:
-            logger.error(f"Error adding resource menu buttons: {e}")
+        add_item = self.add_item
+        for predicate, label, style, custom_id, handler in _MENU_BUTTONS:
+            if predicate(self.config):
+                btn = Button(label=label, style=style, custom_id=custom_id)
+                btn.callback = getattr(self, handler)
+                add_item(btn)
     
     async def _show_general_resources(self, interaction: discord.Interaction) -> None:
         """Show general resources list"""
         try:
-            # Get resources from data manager
-            note, resources = await self.data_manager.get_resources()
+            # Use the prefetched resources unless the prefetch was dropped
+            if self._resources_task.cancelled():
+                note, resources = await self.data_manager.get_resources()
+            else:
+                note, resources = await self._resources_task
             
             view = ResourceListView(
                 self.user,
@@ -89,9 +179,11 @@ class ResourceMenuView(BaseView):
                 note
             )
             
+            embed = view.create_embed()
+            
             self.stop()
             await interaction.response.edit_message(
-                embed=await view.create_embed(),
+                embed=embed,
                 view=view
             )
             view.message = interaction.message
@@ -106,9 +198,7 @@ class ResourceMenuView(BaseView):
     async def _show_notable_players(self, interaction: discord.Interaction) -> None:
         """Show notable players list"""
         try:
-            from .player import PlayerListView
-            
-            view = PlayerListView(
+            view = _player_list_view()(
                 self.user,
                 self.config,
                 self.data_manager,
@@ -117,7 +207,7 @@ class ResourceMenuView(BaseView):
             
             self.stop()
             await interaction.response.edit_message(
-                embed=await view.create_embed(),
+                embed=view.create_embed(),
                 view=view
             )
             view.message = interaction.message
@@ -132,10 +222,8 @@ class ResourceMenuView(BaseView):
     async def _go_back(self, interaction: discord.Interaction) -> None:
         """Return to main menu"""
         try:
-            from views.main_menu import MainMenuView
-            
             self.stop()
-            main_view = MainMenuView(self.user, self.config, self.data_manager)
+            main_view = _main_menu_view()(self.user, self.config, self.data_manager)
             await interaction.response.edit_message(
                 embed=main_view.create_embed(),
                 view=main_view
@@ -150,49 +238,28 @@ class ResourceMenuView(BaseView):
             )
     
     def create_embed(self) -> discord.Embed:
-        """Create resource menu embed"""
-        try:
-            embed = discord.Embed(
-                title="📚 Resources",
-                description="Select a resource category to explore:",
-                color=self.config.embed_color
-            )
-            embed.set_thumbnail(url=self.config.thumbnail_url)
-            
-            # Add resource statistics
-            stats_text = ""
-            
-            # Count general resources (remove async call from sync method)
-            try:
-                # We'll just show that resources are available without counting
-                # The actual count will be shown when the resources are loaded
-                stats_text += "• General resources available\n"
-            except Exception as e:
-                logger.warning(f"Error checking resources: {e}")
-                stats_text += "• General resources available\n"
-            
-            # Count notable players
-            if self.config.notable_players:
-                stats_text += f"• {len(self.config.notable_players)} notable players\n"
-            
-            if stats_text:
-                embed.add_field(
-                    name="📊 Available Resources",
-                    value=stats_text.strip(),
-                    inline=False
-                )
-            
-            embed.set_footer(text="Use the buttons below to browse resources")
-            
-            return embed
-            
-        except Exception as e:
-            logger.error(f"Error creating resource menu embed: {e}")
-            return discord.Embed(
-                title="📚 Resources",
-                description="Welcome to the resources section!",
-                color=self.config.embed_color
-            )
+        """Create resource menu embed, built once per configuration version and resource count"""
+        # Resources live outside the configuration, so their count is part of the key
+        counts = self.data_manager.get_counts_snapshot()
+        return self.config.get_cached_embed(
+            f"resource_menu:{counts['resources']}",
+            lambda: self._build_embed(counts)
+        )
+    
+    def _build_embed(self, counts: Dict[str, int]) -> discord.Embed:
+        """Build the resource menu embed from the current configuration and counts"""
+        stats_text = f"• {counts['resources']} general resources"
+        if counts['notable_players']:
+            stats_text += f"\n• {counts['notable_players']} notable players"
+        
+        return discord.Embed.from_dict({
+            "title": "📚 Resources",
+            "description": "Select a resource category to explore:",
+            "color": self.config.embed_color.value,
+            "thumbnail": {"url": self.config.thumbnail_url},
+            "fields": [{"name": "📊 Available Resources", "value": stats_text, "inline": False}],
+            "footer": {"text": "Use the buttons below to browse resources"}
+        })
 
 
 class ResourceListView(PaginatedView):
@@ -222,82 +289,69 @@ class ResourceListView(PaginatedView):
         self.config = config
         self.data_manager = data_manager
         self.note = note
+        
+        # Resources don't change while the list is open, so render every page once
+        self._type_summary, self._pages = _render_resource_pages(
+            tuple((resource.name, resource.type) for resource in self.items),
+            self.per_page
+        )
+        
         self.update_buttons()
     
+    def _build_page_render(self, page: int) -> List[Dict[str, Any]]:
+        """Get the shared button labels and description lines for a page of resources"""
+        return list(self._pages[page]) if page < len(self._pages) else []
+    
     def _add_page_items(self) -> None:
         """Add resource selection buttons for current page"""
-        try:
-            for i, resource in enumerate(self.current_items):
-                global_index = self.current_page * self.per_page + i
-                
-                # Create button label with resource name and type
-                label = f"{global_index + 1}. {resource.name}"
-                if len(label) > 70:  # Leave room for type indicator
-                    label = f"{global_index + 1}. {resource.name[:60]}..."
-                
-                # Add type indicator
-                type_indicator = f" ({resource.type})" if resource.type else ""
-                if len(label + type_indicator) <= 80:
-                    label += type_indicator
-                
-                btn = Button(
-                    label=label,
-                    style=discord.ButtonStyle.primary,
-                    custom_id=f"resource_{global_index}"
-                )
-                btn.callback = self._make_resource_callback(resource)
-                self.add_item(btn)
-                
-        except Exception as e:
-            logger.error(f"Error adding resource buttons: {e}")
+        for entry in self.get_page_render():
+            btn = Button(
+                label=entry['button_label'],
+                style=discord.ButtonStyle.primary,
+                custom_id=f"resource_{entry['index']}"
+            )
+            btn.callback = self._on_resource_click
+            self.add_item(btn)
     
-    def _make_resource_callback(self, resource: 'ResourceEntry'):
-        """Create callback for resource detail button"""
-        async def callback(interaction: discord.Interaction):
-            try:
-                # Create detailed resource message
-                content = f"**Resource: {resource.name}**\n\n"
-                content += f"**Type:** `{resource.type}`\n"
-                
-                if resource.credit:
-                    content += f"**Credit:** {resource.credit}\n"
-                
-                content += f"\n🔗 **Link:** {resource.link}"
-                
-                # Add helpful description based on resource type
-                type_descriptions = {
-                    'video': '🎥 Video content',
-                    'document': '📄 Text document',
-                    'spreadsheet': '📊 Data spreadsheet',
-                    'guide': '📖 Tutorial or guide',
-                    'tool': '🔧 Utility or tool',
-                    'website': '🌐 Website or web app'
-                }
-                
-                type_desc = type_descriptions.get(resource.type.lower())
-                if type_desc:
-                    content += f"\n\n{type_desc}"
-                
-                await interaction.response.send_message(
+    async def _on_resource_click(self, interaction: discord.Interaction) -> None:
+        """Show details for the resource whose button was clicked"""
+        try:
+            # Resource buttons carry their list index in their custom_id ("resource_<index>")
+            resource = self.items[int(interaction.data["custom_id"][9:])]
+            
+            # Acknowledge first; the reply goes out as a followup
+            await interaction.response.defer(ephemeral=True)
+            
+            # Create detailed resource message
+            parts = [f"**Resource: {resource.name}**", "", f"**Type:** `{resource.type}`"]
+            if resource.credit:
+                parts.append(f"**Credit:** {resource.credit}")
+            parts += ("", f"🔗 **Link:** {resource.link}")
+            
+            # Add helpful description based on resource type
+            type_desc = _TYPE_DESCRIPTIONS.get(resource.type.lower())
+            if type_desc:
+                parts += ("", type_desc)
+            
+            content = "\n".join(parts)
+            
+            async with _detail_reply_slots():
+                await interaction.followup.send(
                     content=content,
                     ephemeral=True,
                     suppress_embeds=False  # Allow link previews
                 )
-                
-            except Exception as e:
-                logger.error(f"Error showing resource details: {e}")
-                await interaction.response.send_message(
-                    f"❌ Failed to load resource details. Please try again.",
-                    ephemeral=True
-                )
-        
-        return callback
+            
+        except Exception as e:
+            logger.error(f"Error showing resource details: {e}")
+            await self._send_error(interaction, "❌ Failed to load resource details. Please try again.")
     
     async def _go_back(self, interaction: discord.Interaction) -> None:
         """Return to resource menu"""
         try:
-            self.stop()
             view = ResourceMenuView(self.user, self.config, self.data_manager)
+            
+            self.stop()
             await interaction.response.edit_message(
                 embed=view.create_embed(),
                 view=view
@@ -311,58 +365,40 @@ class ResourceListView(PaginatedView):
                 ephemeral=True
             )
     
-    async def create_embed(self) -> discord.Embed:
+    def create_embed(self) -> discord.Embed:
         """Create resource list embed"""
-        try:
-            embed = discord.Embed(
-                title=f"🔗 General Resources (Page {self.current_page + 1}/{self.max_pages})",
-                color=self.config.embed_color
-            )
-            embed.set_thumbnail(url=self.config.thumbnail_url)
-            
-            # Add general note if available
-            description = ""
-            if self.note:
-                description = f"{self.note}\n\n"
-            
-            if not self.resources:
-                description += "_No resources configured yet._"
-            else:
-                # List resources on current page
-                for i, resource in enumerate(self.current_items):
-                    global_index = self.current_page * self.per_page + i
-                    description += f"**{global_index + 1}. {resource.name}** ({resource.type})\n"
-                
-                description += "\n**Select a resource for details and link.**"
-            
-            embed.description = description
-            
-            # Add resource type summary if there are resources
-            if self.items:
-                type_counts = {}
-                for resource in self.items:
-                    resource_type = resource.type.lower()
-                    type_counts[resource_type] = type_counts.get(resource_type, 0) + 1
-                
-                if type_counts:
-                    type_summary = ", ".join([f"{count} {rtype}" for rtype, count in type_counts.items()])
-                    embed.add_field(
-                        name="📊 Resource Types",
-                        value=type_summary,
-                        inline=False
-                    )
-            
-            embed.set_footer(text=self.get_page_info())
-            
-            return embed
-            
-        except Exception as e:
-            logger.error(f"Error creating resource list embed: {e}")
-            return discord.Embed(
-                title="❌ Error Loading Resources",
-                description="Failed to load resource list. Please try again.",
-                color=discord.Color.red()
+        embed = discord.Embed(
+            title=f"🔗 General Resources (Page {self.current_page + 1}/{self.max_pages})",
+            color=self.config.embed_color
+        )
+        embed.set_thumbnail(url=self.config.thumbnail_url)
+        
+        # Add general note if available
+        description = ""
+        if self.note:
+            description = f"{self.note}\n\n"
+        
+        if not self.items:
+            description += "_No resources configured yet._"
+        else:
+            # List resources on current page
+            lines = [entry['line'] for entry in self.get_page_render()]
+            lines += ("", "**Select a resource for details and link.**")
+            description += "\n".join(lines)
+        
+        embed.description = description
+        
+        # Add resource type summary if there are resources
+        if self._type_summary:
+            embed.add_field(
+                name="📊 Resource Types",
+                value=self._type_summary,
+                inline=False
             )
+        
+        embed.set_footer(text=self.get_page_info())
+        
+        return embed
 
 
 class ResourceManagementView(PaginatedView):
@@ -384,89 +420,80 @@ class ResourceManagementView(PaginatedView):
         super().__init__(user, self.resources, 5, config.view_timeout_seconds)
         self.config = config
         self.data_manager = data_manager
-        self.update_buttons()
+        
+        # Nothing to page through yet, so only the Back button is needed
+        if self.resources:
+            self.update_buttons()
+        else:
+            self._add_utility_buttons()
     
     def _add_page_items(self) -> None:
         """Add resource management buttons"""
+        for global_index, resource in enumerate(self.current_items, self.page_start):
+            # Management button for each resource
+            btn = Button(
+                label=f"📝 {global_index + 1}. {resource.name[:50]}",
+                style=discord.ButtonStyle.secondary,
+                custom_id=f"manage_resource_{global_index}"
+            )
+            btn.callback = self._on_manage_click
+            self.add_item(btn)
+    
+    async def _on_manage_click(self, interaction: discord.Interaction) -> None:
+        """Show management details for the resource whose button was clicked"""
         try:
-            for i, resource in enumerate(self.current_items):
-                global_index = self.current_page * self.per_page + i
-                
-                # Management button for each resource
-                btn = Button(
-                    label=f"📝 {global_index + 1}. {resource.name[:50]}",
-                    style=discord.ButtonStyle.secondary,
-                    custom_id=f"manage_resource_{global_index}"
-                )
-                btn.callback = self._make_manage_callback(resource)
-                self.add_item(btn)
-                
+            # Management buttons carry their list index in their custom_id ("manage_resource_<index>")
+            resource = self.items[int(interaction.data["custom_id"][16:])]
+            
+            await interaction.response.defer(ephemeral=True)
+            
+            # Show resource details with management options
+            parts = [
+                f"**Managing Resource: {resource.name}**",
+                "",
+                f"**Type:** {resource.type}",
+                f"**Link:** {resource.link}"
+            ]
+            if resource.credit:
+                parts.append(f"**Credit:** {resource.credit}")
+            parts += ("", "_Resource editing and deletion will be implemented in a future update._")
+            content = "\n".join(parts)
+            
+            async with _detail_reply_slots():
+                await interaction.followup.send(content=content, ephemeral=True)
+            
         except Exception as e:
-            logger.error(f"Error adding resource management buttons: {e}")
-    
-    def _make_manage_callback(self, resource: 'ResourceEntry'):
-        """Create callback for resource management"""
-        async def callback(interaction: discord.Interaction):
-            try:
-                # Show resource details with management options
-                content = f"**Managing Resource: {resource.name}**\n\n"
-                content += f"**Type:** {resource.type}\n"
-                content += f"**Link:** {resource.link}\n"
-                if resource.credit:
-                    content += f"**Credit:** {resource.credit}\n"
-                content += "\n_Resource editing and deletion will be implemented in a future update._"
-                
-                await interaction.response.send_message(
-                    content=content,
-                    ephemeral=True
-                )
-                
-            except Exception as e:
-                logger.error(f"Error in resource management callback: {e}")
-                await interaction.response.send_message(
-                    "❌ Failed to load resource for management.",
-                    ephemeral=True
-                )
-        
-        return callback
+            logger.error(f"Error in resource management callback: {e}")
+            await self._send_error(interaction, "❌ Failed to load resource for management.")
     
-    async def create_embed(self) -> discord.Embed:
+    def create_embed(self) -> discord.Embed:
         """Create resource management embed"""
-        try:
-            embed = discord.Embed(
-                title="⚙️ Resource Management",
-                description="Manage general resources for the bot.",
-                color=self.config.embed_color
+        embed = discord.Embed(
+            title="⚙️ Resource Management",
+            description="Manage general resources for the bot.",
+            color=self.config.embed_color
+        )
+        
+        if not self.items:
+            embed.description = "_No resources to manage._"
+        else:
+            embed.add_field(
+                name="📊 Resource Stats",
+                value=f"**Total Resources:** {len(self.resources)}\n"
+                      f"**Current Page:** {self.current_page + 1}/{self.max_pages}",
+                inline=False
             )
             
-            if not self.items:
-                embed.description = "_No resources to manage._"
-            else:
-                embed.add_field(
-                    name="📊 Resource Stats",
-                    value=f"**Total Resources:** {len(self.resources)}\n"
-                          f"**Current Page:** {self.current_page + 1}/{self.max_pages}",
-                    inline=False
-                )
-                
-                embed.add_field(
-                    name="ℹ️ Instructions",
-                    value="Click a resource button to view details.\n"
-                          "Use `/update resources` to add new resources.",
-                    inline=False
-                )
-            
-            embed.set_footer(text="Resource Management Interface")
-            
-            return embed
-            
-        except Exception as e:
-            logger.error(f"Error creating resource management embed: {e}")
-            return discord.Embed(
-                title="❌ Error",
-                description="Failed to load resource management interface.",
-                color=discord.Color.red()
+            embed.add_field(
+                name="ℹ️ Instructions",
+                value="Click a resource button to view details.\n"
+                      "Use `/update resources` to add new resources.",
+                inline=False
             )
+        
+        embed.set_footer(text="Resource Management Interface")
+        
+        return embed
 
 
 class AddResourceView(BaseView):
@@ -508,8 +535,6 @@ class AddResourceView(BaseView):
     async def _add_resource(self, interaction: discord.Interaction) -> None:
         """Show add resource modal"""
         try:
-            from .modals import ResourceModal
-            
             modal = ResourceModal(self.data_manager)
             await interaction.response.send_modal(modal)
             
@@ -16,6 +16,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Pages with more starters than this are listed as embed fields instead of in the description
+_DESCRIPTION_MAX_STARTERS = 10
+
+# Embeds hold at most 25 fields; one is kept for the category info
+_MAX_STARTER_FIELDS = 24
+
 
 class StarterListView(PaginatedView):
     """
@@ -44,82 +50,111 @@ class StarterListView(PaginatedView):
         self.config = config
         self.data_manager = data_manager
         self.category = category
+        # Starter buttons are reused across page flips; only label and custom_id change
+        self._button_pool: List[Button] = []
+        # Starters shown on the current page, as they were when its buttons were built
+        self._page_starters: List[str] = []
+        # Config version the cached page slices were taken from
+        self._items_version = config.version
         self.update_buttons()
     
+    @property
+    def current_items(self) -> List[str]:
+        """Get starters for the current page, re-slicing after starters are added or removed"""
+        # Starter edits elsewhere mutate the shared list in place and bump the config version
+        if self.config.version != self._items_version:
+            self._items_version = self.config.version
+            self.invalidate_page_render()
+        return super().current_items
+    
     def _add_page_items(self) -> None:
         """Add starter selection buttons for current page"""
         try:
-            for i, starter in enumerate(self.current_items):
-                global_index = self.current_page * self.per_page + i
-                
+            # Discord caps labels at 80 characters; size the name budget for the widest index on the page
+            page_end = self.page_start + len(self.current_items)
+            max_starter_len = 80 - len(f"{page_end}. ")
+            
+            pool = self._button_pool
+            self._page_starters = self.current_items
+            for slot, (global_index, starter) in enumerate(enumerate(self._page_starters, self.page_start)):
                 # Create button label with starter name and index
-                button_label = f"{global_index + 1}. {starter}"
-                if len(button_label) > 80:  # Discord button label limit
-                    # Truncate starter name to fit
-                    max_starter_len = 80 - len(f"{global_index + 1}. ") - 3  # 3 for "..."
-                    button_label = f"{global_index + 1}. {starter[:max_starter_len]}..."
+                if len(starter) > max_starter_len:
+                    starter_label = starter[:max_starter_len - 3] + "..."
+                else:
+                    starter_label = starter
                 
-                btn = Button(
-                    label=button_label,
-                    style=discord.ButtonStyle.primary,
-                    custom_id=f"starter_{global_index}"
-                )
-                btn.callback = self._make_starter_callback(starter)
+                if slot == len(pool):
+                    btn = Button(style=discord.ButtonStyle.primary)
+                    btn.callback = self._on_starter_click
+                    pool.append(btn)
+                
+                btn = pool[slot]
+                btn.label = f"{global_index + 1}. {starter_label}"
+                btn.custom_id = f"starter_{global_index}"
                 self.add_item(btn)
                 
         except Exception as e:
             logger.error(f"Error adding starter buttons: {e}")
     
-    def _make_starter_callback(self, starter: str):
-        """Create callback for starter selection button with validation"""
-        async def callback(interaction: discord.Interaction):
-            try:
-                # Validate starter still exists
-                if starter not in self.config.starters.get(self.category, []):
-                    await interaction.response.send_message(
-                        f"❌ Starter '{starter}' is no longer available.",
-                        ephemeral=True
-                    )
-                    return
-                
-                # Get combos for this starter
-                combos = await self.data_manager.get_combos(self.category, starter)
-                
-                if not combos:
-                    await interaction.response.send_message(
-                        f"⚠️ No combos found for **{starter}** in {self.category}.\n"
-                        f"Ask an admin to add combos using `/update {self.category} <playlist_url> {starter}`.",
-                        ephemeral=True
-                    )
-                    return
-                
-                # Import here to avoid circular imports
-                from views.combo_list import ComboListView
-                
-                view = ComboListView(
-                    self.user,
-                    self.config,
-                    self.category,
-                    starter,
-                    combos
-                )
-                
-                # Send combo list as ephemeral message (as in original)
+    async def _on_starter_click(self, interaction: discord.Interaction) -> None:
+        """Show combos for the starter whose button was clicked"""
+        # Starter buttons carry their list index in their custom_id ("starter_<index>")
+        index = int(interaction.data["custom_id"][8:]) - self.page_start
+        
+        # A click from a stale message may point past the current page
+        if not 0 <= index < len(self._page_starters):
+            await interaction.response.send_message(
+                "❌ That starter is no longer available.",
+                ephemeral=True
+            )
+            return
+        starter = self._page_starters[index]
+        
+        try:
+            # Validate starter still exists
+            if starter not in self.config.starters.get(self.category, []):
                 await interaction.response.send_message(
-                    embed=await view.create_embed(),
-                    view=view,
+                    f"❌ Starter '{starter}' is no longer available.",
                     ephemeral=True
                 )
-                view.message = await interaction.original_response()
-                
-            except Exception as e:
-                logger.error(f"Error in starter callback for '{starter}': {e}")
-                await interaction.response.send_message(
-                    f"❌ Failed to load combos for **{starter}**. Please try again.",
+                return
+            
+            # Acknowledge first so building the combo list can't outlast the interaction deadline
+            await interaction.response.defer(ephemeral=True)
+            
+            # Get combos for this starter
+            combos = await self.data_manager.get_combos(self.category, starter)
+            
+            if not combos:
+                await interaction.followup.send(
+                    f"⚠️ No combos found for **{starter}** in {self.category}.\n"
+                    f"Ask an admin to add combos using `/update {self.category} <playlist_url> {starter}`.",
                     ephemeral=True
                 )
-        
-        return callback
+                return
+            
+            # Import here to avoid circular imports
+            from views.combo_list import ComboListView
+            
+            view = ComboListView(
+                self.user,
+                self.config,
+                self.category,
+                starter,
+                combos
+            )
+            
+            # Send combo list as ephemeral message (as in original)
+            view.message = await interaction.followup.send(
+                embed=await view.create_embed(),
+                view=view,
+                ephemeral=True,
+                wait=True
+            )
+            
+        except Exception as e:
+            logger.error(f"Error in starter callback for '{starter}': {e}")
+            await self._send_error(interaction, f"❌ Failed to load combos for **{starter}**. Please try again.")
     
     async def _go_back(self, interaction: discord.Interaction) -> None:
         """Return to main menu"""
@@ -153,40 +188,36 @@ class StarterListView(PaginatedView):
             if not self.items:
                 embed.description = f"_No starters configured for {self.category} yet._"
             else:
+                # The items are the category's starters, so one lookup covers the page and the total
+                counts = await self.data_manager.get_combo_counts(self.category, self.items)
+                # Long pages go into inline fields so no single description block grows huge
+                use_fields = len(self.current_items) > _DESCRIPTION_MAX_STARTERS
                 descriptions = []
                 
-                # Get combo counts for current page starters
-                for i, starter in enumerate(self.current_items):
-                    global_index = self.current_page * self.per_page + i
+                for global_index, starter in enumerate(self.current_items, self.page_start):
+                    combo_count = counts.get(starter, 0)
+                    if combo_count > 0:
+                        note = f"{combo_count} combo{'s' if combo_count != 1 else ''}"
+                    else:
+                        note = "No combos yet"
                     
-                    try:
-                        # Get combo count asynchronously
-                        combo_count = await self.data_manager.get_combo_count(self.category, starter)
-                        
-                        if combo_count > 0:
-                            note = f"{combo_count} combo{'s' if combo_count != 1 else ''}"
-                        else:
-                            note = "No combos yet"
-                        
+                    if use_fields:
+                        # Leave room for the category info field
+                        if len(embed.fields) >= _MAX_STARTER_FIELDS:
+                            break
+                        embed.add_field(name=f"{global_index + 1}. {starter}", value=f"_{note}_", inline=True)
+                    else:
                         descriptions.append(f"**{global_index + 1}. {starter}** - _{note}_")
-                        
-                    except Exception as e:
-                        logger.warning(f"Error getting combo count for {starter}: {e}")
-                        descriptions.append(f"**{global_index + 1}. {starter}** - _Unknown_")
                 
-                embed.description = "\n".join(descriptions)
+                if descriptions:
+                    embed.description = "\n".join(descriptions)
             
             # Add helpful footer
             embed.set_footer(text="Select a starter to view its combos")
             
             # Add category info field if there are starters
             if self.items:
-                total_combos = 0
-                try:
-                    for starter in self.config.starters.get(self.category, []):
-                        total_combos += await self.data_manager.get_combo_count(self.category, starter)
-                except Exception as e:
-                    logger.warning(f"Error calculating total combos: {e}")
+                total_combos = sum(counts.values())
                 
                 info_text = f"**Category:** {self.category}\n"
                 info_text += f"**Total Starters:** {len(self.items)}\n"
@@ -237,9 +268,7 @@ class StarterManagementView(PaginatedView):
     def _add_page_items(self) -> None:
         """Add starter management buttons"""
         try:
-            for i, starter in enumerate(self.current_items):
-                global_index = self.current_page * self.per_page + i
-                
+            for global_index, starter in enumerate(self.current_items, self.page_start):
                 # Remove button for each starter
                 btn = Button(
                     label=f"🗑️ {global_index + 1}. {starter[:50]}",
@@ -290,6 +319,7 @@ class StarterManagementView(PaginatedView):
                         
                         # Refresh the management view
                         self.items = self.config.starters.get(self.category, [])
+                        self.invalidate_page_render()
                         if self.current_page >= self.max_pages:
                             self.current_page = max(0, self.max_pages - 1)
                         self.update_buttons()
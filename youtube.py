@@ -4,19 +4,105 @@ Handles playlist parsing, video processing, and error handling
 """
 
 import re
+import json
+import time
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
-from urllib.parse import urlparse, parse_qs
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple, Any
 
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, build_http
 
 from utils import async_ttl_cache, RateLimiter
 from config import CACHE_DURATION_SECONDS
 
 logger = logging.getLogger(__name__)
 
+# Playlist and watch URLs (youtube.com, www./m. variants, youtu.be) with a list parameter
+_PLAYLIST_URL_RE = re.compile(
+    r"https?://(?:(?:www\.|m\.)?youtube\.com/(?:playlist|watch[^?#]*)|youtu\.be/[^?#]*)"
+    r"\?(?:[^#]*&)?list=([A-Za-z0-9_-]+)",
+    re.IGNORECASE
+)
+
+# Part of a video description searched for notation and notes labels
+_DESCRIPTION_SCAN_LINES = 10
+_DESCRIPTION_SCAN_CHARS = 2048
+
+# Most playlists kept in the fetch cache at once
+_PLAYLIST_CACHE_SIZE = 256
+
+# Shared read-only stand-in for missing API response sections
+_EMPTY = MappingProxyType({})
+
+# Placeholder titles YouTube gives playlist entries for removed videos
+_SKIP_TITLES = frozenset(("Deleted video", "Private video"))
+
+# HttpError reasons that mean the API quota is used up
+_QUOTA_REASONS = frozenset(("quotaExceeded", "dailyLimitExceeded"))
+
+# Bare playlist IDs: an optional known prefix followed by 10+ ID characters
+_PLAYLIST_ID_RE = re.compile(r"^(PL|UU|FL|OL|RD)?[a-zA-Z0-9_-]{10,}$")
+
+# "Note:" line in a playlist description
+_PLAYLIST_NOTE_RE = re.compile(r"Note:\s*(.+)", re.IGNORECASE | re.MULTILINE)
+
+# Video description labels, one pattern per label in order of preference
+_NOTATION_RES = tuple(
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (r"notation:\s*(.+)", r"combo:\s*(.+)", r"inputs?:\s*(.+)")
+)
+_NOTES_RES = tuple(
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (r"notes?:\s*(.+)", r"tips?:\s*(.+)", r"comments?:\s*(.+)")
+)
+
+
+def _find_labelled_value(patterns: Tuple[re.Pattern, ...], text: str) -> Optional[str]:
+    """
+    Find the first line of text following the most preferred label
+    
+    Args:
+        patterns: Compiled label patterns in order of preference, each with one value group
+        text: Text to search
+        
+    Returns:
+        Value for the first label that has one, or None if no label has a value
+    """
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            # Take only the first line of the value
+            value = match.group(1).strip().split('\n')[0].strip()
+            if value:
+                return value
+    
+    return None
+
+
+@lru_cache(maxsize=512)
+def _extract_playlist_id_cached(url_or_id: str) -> Optional[str]:
+    """Extract a playlist ID from a URL or bare ID; see YouTubeService.extract_playlist_id"""
+    url_or_id = url_or_id.strip()
+    
+    # YouTube playlist or watch URL carrying a list parameter
+    match = _PLAYLIST_URL_RE.match(url_or_id)
+    if match:
+        return match.group(1)
+    
+    # Check if it's already a playlist ID
+    # YouTube playlist IDs typically start with PL, UU, FL, OL, or RD
+    # and are followed by 10+ characters
+    if _PLAYLIST_ID_RE.match(url_or_id):
+        return url_or_id
+    
+    return None
+
 
 class YouTubeService:
     """
@@ -30,16 +116,36 @@ class YouTubeService:
     - Video description parsing for combo notation and notes
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache_file: Optional[str] = None):
         """
         Initialize YouTube service
         
         Args:
             api_key: YouTube Data API v3 key
+            cache_file: JSON file that keeps fetched playlists across restarts (None to disable)
         """
         self.api_key = api_key
         self._service = None
         
+        # Fetched playlists persisted to disk, loaded on first use
+        self._cache_file = Path(cache_file) if cache_file else None
+        self._disk_entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._disk_lock = asyncio.Lock()
+        # httplib2.Http isn't thread-safe, so each worker thread keeps its own connections
+        self._local = threading.local()
+        
+        # Playlist cache per service, keyed by playlist ID alone so the service is never
+        # pickled into cache keys; bounded so many distinct playlists can't grow it forever.
+        # It only wraps API fetches, so disk hits are never kept past their original TTL
+        self._playlist_cache = async_ttl_cache(
+            CACHE_DURATION_SECONDS, maxsize=_PLAYLIST_CACHE_SIZE
+        )(self._fetch_playlist_uncached)
+        self._cache_clear = self._playlist_cache.clear_cache
+        self._cache_info = self._playlist_cache.cache_info
+        
+        # Fetches in progress, so concurrent requests for one playlist share a single fetch
+        self._inflight: Dict[str, asyncio.Task] = {}
+        
         # Rate limiter: 100 requests per 100 seconds (YouTube default quota)
         self.rate_limiter = RateLimiter(max_calls=90, time_window=100.0)
         
@@ -50,13 +156,34 @@ class YouTubeService:
         """Lazy load YouTube service to avoid unnecessary initialization"""
         if not self._service:
             try:
-                self._service = build("youtube", "v3", developerKey=self.api_key)
+                # Bundled discovery document avoids a discovery round trip on first use
+                self._service = build(
+                    "youtube", "v3",
+                    developerKey=self.api_key,
+                    static_discovery=True,
+                    cache_discovery=False
+                )
                 logger.info("YouTube API service connected")
             except Exception as e:
                 logger.error(f"Failed to initialize YouTube service: {e}")
                 raise
         return self._service
     
+    def _execute(self, request: HttpRequest) -> Dict[str, Any]:
+        """
+        Execute an API request on this thread's pooled HTTP connection
+        
+        Args:
+            request: Request built from the YouTube service
+            
+        Returns:
+            Decoded API response
+        """
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = build_http()
+        return request.execute(http=http)
+    
     @staticmethod
     def extract_playlist_id(url_or_id: str) -> Optional[str]:
         """
@@ -66,6 +193,8 @@ class YouTubeService:
         - https://www.youtube.com/playlist?list=PLxxxxxxx
         - https://youtube.com/playlist?list=PLxxxxxxx
         - https://m.youtube.com/playlist?list=PLxxxxxxx
+        - https://www.youtube.com/watch?v=xxxx&list=PLxxxxxxx
+        - https://youtu.be/xxxx?list=PLxxxxxxx
         - PLxxxxxxx (direct ID)
         
         Args:
@@ -77,40 +206,107 @@ class YouTubeService:
         if not url_or_id or not isinstance(url_or_id, str):
             return None
         
-        url_or_id = url_or_id.strip()
+        return _extract_playlist_id_cached(url_or_id)
+    
+    async def fetch_playlist(self, playlist_id: str) -> Dict[str, Any]:
+        """
+        Fetch playlist data with caching and error handling
         
-        try:
-            parsed = urlparse(url_or_id)
-            
-            # Check if it's a YouTube URL
-            if parsed.hostname in ('www.youtube.com', 'youtube.com', 'm.youtube.com'):
-                if parsed.path == '/playlist':
-                    query_params = parse_qs(parsed.query)
-                    playlist_ids = query_params.get('list', [])
-                    if playlist_ids:
-                        return playlist_ids[0]
-                elif parsed.path.startswith('/watch') and 'list' in parsed.query:
-                    # Handle watch URLs with playlist parameter
-                    query_params = parse_qs(parsed.query)
-                    playlist_ids = query_params.get('list', [])
-                    if playlist_ids:
-                        return playlist_ids[0]
-            
-            # Check if it's already a playlist ID
-            # YouTube playlist IDs typically start with PL, UU, FL, OL, or RD
-            # and are followed by 10+ characters
-            if re.match(r"^(PL|UU|FL|OL|RD)?[a-zA-Z0-9_-]{10,}$", url_or_id):
-                return url_or_id
+        Args:
+            playlist_id: YouTube playlist ID
             
-        except Exception as e:
-            logger.warning(f"Error parsing playlist URL/ID '{url_or_id}': {e}")
+        Returns:
+            Dictionary containing playlist note and processed videos
+            
+        Raises:
+            ValueError: For various error conditions with descriptive messages
+        """
+        task = self._inflight.get(playlist_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch_playlist_persisted(playlist_id))
+            self._inflight[playlist_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(playlist_id, None))
         
-        return None
+        # Shielded so one caller giving up doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
     
-    @async_ttl_cache(CACHE_DURATION_SECONDS)
-    async def fetch_playlist(self, playlist_id: str) -> Dict[str, Any]:
+    async def _fetch_playlist_persisted(self, playlist_id: str) -> Dict[str, Any]:
         """
-        Fetch playlist data with caching and error handling
+        Fetch playlist data from the disk cache, or through the in-memory cache if not
+        stored or expired
+        
+        Args:
+            playlist_id: YouTube playlist ID
+            
+        Returns:
+            Dictionary containing playlist note and processed videos
+        """
+        if self._cache_file is None:
+            return await self._playlist_cache(playlist_id)
+        
+        async with self._disk_lock:
+            entry = (await self._load_disk_cache()).get(playlist_id)
+        if entry and time.time() - entry.get("ts", 0) < CACHE_DURATION_SECONDS:
+            logger.debug(f"Disk cache hit for playlist {playlist_id}")
+            return entry["value"]
+        
+        fetched_at = time.time()
+        result = await self._playlist_cache(playlist_id)
+        
+        async with self._disk_lock:
+            # Look the entries up again; clear_cache may have replaced them meanwhile
+            entries = await self._load_disk_cache()
+            entries[playlist_id] = {"ts": fetched_at, "value": result}
+            await self._save_disk_cache()
+        
+        return result
+    
+    async def _load_disk_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load persisted playlists on first use; the caller must hold the disk lock"""
+        if self._disk_entries is None:
+            self._disk_entries = {}
+            if self._cache_file.exists():
+                try:
+                    content = await asyncio.to_thread(self._cache_file.read_text, encoding='utf-8')
+                    data = json.loads(content)
+                    if isinstance(data, dict):
+                        self._disk_entries = {
+                            pid: entry for pid, entry in data.items()
+                            if isinstance(entry, dict) and "ts" in entry and "value" in entry
+                        }
+                    logger.info(f"Loaded {len(self._disk_entries)} cached playlists from {self._cache_file}")
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable YouTube cache file: {e}")
+        return self._disk_entries
+    
+    async def _save_disk_cache(self) -> None:
+        """Drop expired playlists and atomically write the rest; the caller must hold the disk lock"""
+        now = time.time()
+        fresh = sorted(
+            ((pid, entry) for pid, entry in self._disk_entries.items()
+             if now - entry.get("ts", 0) < CACHE_DURATION_SECONDS),
+            key=lambda item: item[1]["ts"]
+        )
+        self._disk_entries = dict(fresh[-_PLAYLIST_CACHE_SIZE:])
+        
+        entries = self._disk_entries
+        temp_file = self._cache_file.with_suffix('.tmp')
+        
+        def write_file():
+            """Synchronous file write operation"""
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            temp_file.replace(self._cache_file)
+        
+        try:
+            await asyncio.to_thread(write_file)
+        except Exception as e:
+            # The in-memory cache still works; persistence is best effort
+            logger.warning(f"Failed to save YouTube cache file: {e}")
+    
+    async def _fetch_playlist_uncached(self, playlist_id: str) -> Dict[str, Any]:
+        """
+        Fetch playlist data from the API, bypassing the cache
         
         Args:
             playlist_id: YouTube playlist ID
@@ -130,15 +326,21 @@ class YouTubeService:
             logger.warning(f"Rate limited, waiting {wait_time:.1f} seconds")
             await asyncio.sleep(wait_time)
         
+        # Start on the first page of videos while the metadata request is in flight
+        first_page = asyncio.create_task(self._fetch_items_page(playlist_id, None, 50))
+        # Mark a failure as retrieved in case the metadata check bails out first
+        first_page.add_done_callback(lambda task: task.cancelled() or task.exception())
+        
         try:
             logger.info(f"Fetching playlist: {playlist_id}")
             
             # Get playlist metadata
             playlist_response = await asyncio.to_thread(
+                self._execute,
                 self.service.playlists().list(
                     part="snippet,status",
                     id=playlist_id
-                ).execute
+                )
             )
             
             if not playlist_response.get("items"):
@@ -162,7 +364,7 @@ class YouTubeService:
             logger.info(f"Found playlist: '{playlist_title}' with {snippet.get('itemCount', 0)} items")
             
             # Fetch playlist videos
-            videos = await self._fetch_playlist_videos(playlist_id)
+            videos = await self._fetch_playlist_videos(playlist_id, first_page=first_page)
             
             logger.info(f"Successfully fetched {len(videos)} videos from playlist")
             
@@ -179,63 +381,95 @@ class YouTubeService:
         except Exception as e:
             logger.error(f"Unexpected error fetching playlist {playlist_id}: {e}")
             raise ValueError(f"Failed to fetch playlist: {str(e)}")
+        finally:
+            first_page.cancel()
     
-    async def _fetch_playlist_videos(self, playlist_id: str, max_videos: int = 200) -> List[Dict[str, str]]:
+    async def _fetch_items_page(self, playlist_id: str, page_token: Optional[str],
+                                max_results: int) -> Dict[str, Any]:
+        """
+        Fetch one page of playlist items, waiting out the rate limit first
+        
+        Args:
+            playlist_id: YouTube playlist ID
+            page_token: Token from the previous page, or None for the first page
+            max_results: Maximum items to return (at most 50)
+            
+        Returns:
+            Raw playlistItems response
+        """
+        if not self.rate_limiter.can_proceed():
+            wait_time = self.rate_limiter.time_until_next_call()
+            await asyncio.sleep(wait_time)
+        
+        return await asyncio.to_thread(
+            self._execute,
+            self.service.playlistItems().list(
+                part="snippet,contentDetails",
+                playlistId=playlist_id,
+                maxResults=max_results,
+                pageToken=page_token
+            )
+        )
+    
+    async def _fetch_playlist_videos(self, playlist_id: str, max_videos: int = 200,
+                                     first_page: Optional[asyncio.Task] = None) -> List[Dict[str, str]]:
         """
         Fetch all videos from a playlist with pagination
         
+        The next page is requested before the current page is processed, so
+        processing overlaps the network round trip.
+        
         Args:
             playlist_id: YouTube playlist ID
             max_videos: Maximum number of videos to fetch
+            first_page: Already started request for the first page, if any
             
         Returns:
             List of processed video dictionaries
         """
         videos = []
-        page_token = None
+        next_page = first_page or asyncio.create_task(
+            self._fetch_items_page(playlist_id, None, min(50, max_videos))
+        )
         
-        while len(videos) < max_videos:
+        while next_page is not None:
             try:
-                # Rate limiting check
-                if not self.rate_limiter.can_proceed():
-                    wait_time = self.rate_limiter.time_until_next_call()
-                    await asyncio.sleep(wait_time)
-                
-                # Fetch playlist items
-                items_response = await asyncio.to_thread(
-                    self.service.playlistItems().list(
-                        part="snippet,contentDetails",
-                        playlistId=playlist_id,
-                        maxResults=min(50, max_videos - len(videos)),
-                        pageToken=page_token
-                    ).execute
-                )
-                
-                items = items_response.get("items", [])
-                if not items:
-                    break
-                
-                # Process videos
-                for item in items:
-                    try:
-                        video_data = self._process_video_item(item)
-                        if video_data:
-                            videos.append(video_data)
-                    except Exception as e:
-                        logger.warning(f"Error processing video item: {e}")
-                        continue
-                
-                # Check for next page
-                page_token = items_response.get("nextPageToken")
-                if not page_token:
-                    break
-                    
+                items_response = await next_page
             except HttpError as e:
                 logger.error(f"Error fetching playlist items: {e}")
                 break
             except Exception as e:
                 logger.error(f"Unexpected error fetching playlist items: {e}")
                 break
+            
+            next_page = None
+            items = items_response.get("items", [])
+            if not items:
+                break
+            
+            # Request the next page now; skipped items can only leave more room than this
+            page_token = items_response.get("nextPageToken")
+            remaining = max_videos - len(videos) - len(items)
+            if page_token and remaining > 0:
+                next_page = asyncio.create_task(
+                    self._fetch_items_page(playlist_id, page_token, min(50, remaining))
+                )
+            
+            # Process videos
+            for item in items:
+                try:
+                    video_data = self._process_video_item(item)
+                    if video_data:
+                        videos.append(video_data)
+                except Exception as e:
+                    logger.warning(f"Error processing video item: {e}")
+                    continue
+            
+            # Skipped videos left room the prefetch didn't account for
+            if next_page is None and page_token and len(videos) < max_videos:
+                next_page = asyncio.create_task(
+                    self._fetch_items_page(playlist_id, page_token, min(50, max_videos - len(videos)))
+                )
         
         return videos
     
@@ -250,21 +484,21 @@ class YouTubeService:
             Processed video data or None if invalid
         """
         try:
-            snippet = item.get("snippet", {})
-            content_details = item.get("contentDetails", {})
+            snippet = item.get("snippet") or _EMPTY
             
             # Get video ID
-            video_id = snippet.get("resourceId", {}).get("videoId")
+            video_id = (snippet.get("resourceId") or _EMPTY).get("videoId")
             if not video_id:
                 return None
             
+            # Extract video information
+            title = snippet.get("title", "Untitled Video")
+            
             # Skip deleted/private videos
-            if snippet.get("title") == "Deleted video" or snippet.get("title") == "Private video":
+            if title in _SKIP_TITLES:
                 logger.debug(f"Skipping deleted/private video: {video_id}")
                 return None
             
-            # Extract video information
-            title = snippet.get("title", "Untitled Video")
             description = snippet.get("description", "")
             
             # Parse description for combo data
@@ -296,7 +530,7 @@ class YouTubeService:
             return "No overall notes provided."
         
         # Look for "Note:" pattern in description
-        note_match = re.search(r"(?i)Note:\s*(.+)", description, re.MULTILINE)
+        note_match = _PLAYLIST_NOTE_RE.search(description)
         if note_match:
             note = note_match.group(1).strip()
             # Take only the first line of the note
@@ -312,61 +546,44 @@ class YouTubeService:
         return "No overall notes provided."
     
     @staticmethod
-    def _parse_video_description(description: str) -> Dict[str, str]:
+    @lru_cache(maxsize=1024)
+    def _parse_video_description(description: str) -> Mapping[str, str]:
         """
         Parse video description for combo notation and notes
         
+        Results are cached, since creators often reuse one description template
+        
         Args:
             description: Video description text
             
         Returns:
-            Dictionary with 'notation' and 'notes' keys
+            Read-only mapping with 'notation' and 'notes' keys
         """
         notation = "Unknown Notation"
         notes = "No Notes Provided"
         
         if not description:
-            return {"notation": notation, "notes": notes}
+            return MappingProxyType({"notation": notation, "notes": notes})
+        
+        # Labels sit near the top; skip the links and hashtags that usually follow
+        description = "\n".join(description.split("\n", _DESCRIPTION_SCAN_LINES)[:_DESCRIPTION_SCAN_LINES])
+        description = description[:_DESCRIPTION_SCAN_CHARS]
         
         # Look for notation pattern
-        notation_patterns = [
-            r"(?i)notation:\s*(.+)",
-            r"(?i)combo:\s*(.+)",
-            r"(?i)inputs?:\s*(.+)"
-        ]
-        
-        for pattern in notation_patterns:
-            match = re.search(pattern, description, re.MULTILINE)
-            if match:
-                found_notation = match.group(1).strip()
-                # Take only the first line and clean it up
-                found_notation = found_notation.split('\n')[0].strip()
-                if found_notation:
-                    # Replace common separators for better readability
-                    notation = found_notation.replace(",", " >").replace("->", " >")
-                    break
+        found_notation = _find_labelled_value(_NOTATION_RES, description)
+        if found_notation:
+            # Replace common separators for better readability
+            notation = found_notation.replace(",", " >").replace("->", " >")
         
         # Look for notes pattern
-        notes_patterns = [
-            r"(?i)notes?:\s*(.+)",
-            r"(?i)tips?:\s*(.+)",
-            r"(?i)comments?:\s*(.+)"
-        ]
-        
-        for pattern in notes_patterns:
-            match = re.search(pattern, description, re.MULTILINE)
-            if match:
-                found_notes = match.group(1).strip()
-                # Take only the first line
-                found_notes = found_notes.split('\n')[0].strip()
-                if found_notes:
-                    notes = found_notes
-                    break
-        
-        return {
+        found_notes = _find_labelled_value(_NOTES_RES, description)
+        if found_notes:
+            notes = found_notes
+        
+        return MappingProxyType({
             "notation": notation[:500],  # Limit length
             "notes": notes[:300]  # Limit length
-        }
+        })
     
     @staticmethod
     def _handle_http_error(error: HttpError, playlist_id: str) -> str:
@@ -386,8 +603,7 @@ class YouTubeService:
             return f"Invalid playlist ID: '{playlist_id}'"
         elif status_code == 403:
             # Check if it's quota exceeded or access forbidden
-            error_content = str(error.content)
-            if "quotaExceeded" in error_content or "dailyLimitExceeded" in error_content:
+            if YouTubeService._is_quota_error(error):
                 return "YouTube API quota exceeded. Please try again later or contact the bot administrator."
             else:
                 return f"Access forbidden to playlist '{playlist_id}'. It may be private or restricted."
@@ -400,14 +616,48 @@ class YouTubeService:
         else:
             return f"YouTube API error (status {status_code}). Please try again or contact support."
     
-    def clear_cache(self) -> None:
-        """Clear all cached playlist data"""
-        if hasattr(self.fetch_playlist, 'clear_cache'):
-            self.fetch_playlist.clear_cache()
-            logger.info("YouTube service cache cleared")
+    @staticmethod
+    def _is_quota_error(error: HttpError) -> bool:
+        """
+        Check whether an HttpError reports an exhausted API quota
+        
+        Args:
+            error: HttpError from YouTube API
+            
+        Returns:
+            True if the error reason is quotaExceeded or dailyLimitExceeded
+        """
+        # googleapiclient parses the error reasons when the error is created
+        details = error.error_details
+        if isinstance(details, list):
+            return any(
+                isinstance(detail, dict) and detail.get("reason") in _QUOTA_REASONS
+                for detail in details
+            )
+        
+        # Unparsed bodies: search the raw bytes without decoding them
+        content = error.content or b""
+        return b"quotaExceeded" in content or b"dailyLimitExceeded" in content
+    
+    async def clear_cache(self, include_disk: bool = True) -> None:
+        """
+        Clear all cached playlist data
+        
+        Args:
+            include_disk: If True, also drop persisted playlists and remove the cache file
+        """
+        self._cache_clear()
+        
+        if include_disk and self._cache_file is not None:
+            async with self._disk_lock:
+                self._disk_entries = {}
+                try:
+                    await asyncio.to_thread(self._cache_file.unlink, missing_ok=True)
+                except OSError as e:
+                    logger.warning(f"Failed to remove YouTube cache file: {e}")
+        
+        logger.info("YouTube service cache cleared")
     
     def get_cache_info(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        if hasattr(self.fetch_playlist, 'cache_info'):
-            return self.fetch_playlist.cache_info()
-        return {"error": "Cache info not available"}
+        return self._cache_info()